@@ -6,7 +6,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from typing import Dict, Any, Optional
 
-from src.services.auth_service import AuthService
+from src.services.auth_service import AuthService, get_default_auth_service
 from src.schemas.auth import AuthResult, AuthStatus, UserInfo
 
 # 라우터 생성
@@ -16,8 +16,8 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# 서비스 인스턴스
-auth_service = AuthService()
+# 서비스 인스턴스 (인증 상태 캐시를 이메일 라우터와 공유)
+auth_service = get_default_auth_service()
 
 
 def get_auth_service():
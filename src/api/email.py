@@ -1,16 +1,16 @@
 """이메일 API 라우터
 
 이 모듈은 이메일 관련 API 엔드포인트를 제공합니다.
-get_inbox_emails_with_body 함수만 노출됩니다.
+수신함 조회(get_inbox_emails_with_body)와 델타 새로고침(refresh)이 노출됩니다.
 """
 
 from fastapi import APIRouter, HTTPException, Depends, Query
 from typing import List, Optional, Union
 from datetime import datetime
 
-from src.services.email_service import EmailService
-from src.services.auth_service import AuthService
-from src.schemas.email import EmailDto
+from src.services.threaded_email_service import ThreadedEmailService
+from src.services.auth_service import AuthService, get_default_auth_service
+from src.schemas.email import DeltaRefreshResult, EmailDto
 from src.utils.exceptions import EmailProcessingError, GraphApiError
 
 # 라우터 생성
@@ -20,13 +20,14 @@ router = APIRouter(
     responses={404: {"description": "Not found"}},
 )
 
-# 서비스 인스턴스
-email_service = EmailService()
-auth_service = AuthService()
+# 서비스 인스턴스 (Graph API 호출이 이벤트 루프를 막지 않도록 비동기 서비스 사용)
+email_service = ThreadedEmailService()
+# 인증 상태 캐시를 인증 라우터와 공유
+auth_service = get_default_auth_service()
 
 
 def get_email_service():
-    """의존성 주입을 위한 EmailService 인스턴스 제공"""
+    """의존성 주입을 위한 ThreadedEmailService 인스턴스 제공"""
     return email_service
 
 
@@ -53,7 +54,7 @@ async def get_inbox_emails(
     limit: int = Query(1000, description="최대 결과 수"),
     filter_senders: bool = Query(True, description="발신자 필터링 적용 여부"),
     convert_html_to_text: bool = Query(True, description="HTML 본문을 텍스트로 변환할지 여부"),
-    email_service: EmailService = Depends(get_email_service),
+    email_service: ThreadedEmailService = Depends(get_email_service),
     auth: AuthService = Depends(require_authentication)
 ) -> List[EmailDto]:
     """수신함 이메일을 본문과 함께 조회합니다.
@@ -73,7 +74,7 @@ async def get_inbox_emails(
         HTTPException: API 요청 처리 중 오류 발생 시
     """
     try:
-        return email_service.get_inbox_emails_with_body(
+        return await email_service.get_inbox_emails_with_body(
             start_date=start_date,
             end_date=end_date,
             days=days,
@@ -90,3 +91,45 @@ async def get_inbox_emails(
     except Exception as e:
         # 기타 오류 처리
         raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
+
+
+@router.get("/refresh", response_model=DeltaRefreshResult)
+async def refresh_emails(
+    folder: str = Query("inbox", description="폴더 (inbox, sentItems 등)"),
+    filter_senders: bool = Query(True, description="발신자 필터링 적용 여부"),
+    convert_html_to_text: bool = Query(True, description="HTML 본문을 텍스트로 변환할지 여부"),
+    email_service: ThreadedEmailService = Depends(get_email_service),
+    auth: AuthService = Depends(require_authentication)
+) -> DeltaRefreshResult:
+    """마지막 조회 이후 변경된 이메일만 조회합니다.
+    
+    주기적인 폴링은 /inbox 대신 이 엔드포인트를 사용합니다.
+    reset이 True이면 델타 링크가 만료되어 emails가 기본 범위의 전체 목록이므로 기존 목록을 교체하고,
+    has_more가 True이면 남은 변경분을 받기 위해 바로 다시 호출합니다.
+    
+    Args:
+        folder: 폴더 (inbox, sentItems 등)
+        filter_senders: 발신자 필터링 적용 여부
+        convert_html_to_text: HTML 본문을 텍스트로 변환할지 여부
+        
+    Returns:
+        DeltaRefreshResult: 변경된 이메일 DTO 리스트 (본문 포함)와 초기화/추가 변경분 여부
+        
+    Raises:
+        HTTPException: API 요청 처리 중 오류 발생 시
+    """
+    try:
+        return await email_service.refresh(
+            folder=folder,
+            filter_senders=filter_senders,
+            convert_html_to_text=convert_html_to_text
+        )
+    except GraphApiError as e:
+        # Graph API 오류 처리
+        raise HTTPException(status_code=502, detail=f"Graph API 오류: {str(e)}")
+    except EmailProcessingError as e:
+        # 이메일 처리 오류 처리
+        raise HTTPException(status_code=500, detail=f"이메일 처리 오류: {str(e)}")
+    except Exception as e:
+        # 기타 오류 처리
+        raise HTTPException(status_code=500, detail=f"서버 오류: {str(e)}")
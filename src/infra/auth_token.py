@@ -342,7 +342,7 @@ class AuthTokenManager:
                 status=AuthStatus(
                     is_authenticated=True,
                     user_info=user_info,
-                    scopes=token_response.get("scope", "").split(),
+                    scopes=tuple(token_response.get("scope", "").split()),
                     token_expires_at=expires_at,
                     auth_method="authorization_code"
                 )
@@ -411,7 +411,7 @@ class AuthTokenManager:
                 status=AuthStatus(
                     is_authenticated=True,
                     user_info=user_info,
-                    scopes=token_response.get("scope", "").split(),
+                    scopes=tuple(token_response.get("scope", "").split()),
                     token_expires_at=expires_at,
                     auth_method="device_flow"
                 )
@@ -457,7 +457,7 @@ class AuthTokenManager:
                 status=AuthStatus(
                     is_authenticated=True,
                     user_info=None,  # 클라이언트 자격 증명 흐름에서는 사용자 정보 없음
-                    scopes=token_response.get("scope", "").split(),
+                    scopes=tuple(token_response.get("scope", "").split()),
                     token_expires_at=expires_at,
                     auth_method="client_credentials"
                 )
@@ -522,7 +522,7 @@ class AuthTokenManager:
             auth_method = "user_flow"  # 인증 코드 또는 디바이스 코드 흐름
         
         # 권한 범위 확인
-        scopes = token.get("scope", "").split()
+        scopes = tuple(token.get("scope", "").split())
         
         return AuthStatus(
             is_authenticated=True,
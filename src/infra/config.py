@@ -7,7 +7,7 @@
 import os
 import json
 from pathlib import Path
-from typing import List, Optional, Dict, Any
+from typing import List, Optional, Dict, Any, FrozenSet
 from dotenv import load_dotenv
 
 from src.utils.logging_config import LoggerFactory
@@ -82,10 +82,20 @@ class Config:
     DEFAULT_DAYS = int(os.environ.get("DEFAULT_DAYS", "7"))
     DEFAULT_LIMIT = int(os.environ.get("DEFAULT_LIMIT", "50"))
     
+    # 많은 양의 메시지를 $skip 범위별 병렬 요청으로 조회할지 여부
+    # (조회 중 메일함이 바뀌면 메시지가 중복되거나 빠질 수 있으므로 기본값은 사용 안 함)
+    PARALLEL_FETCH = os.environ.get("PARALLEL_FETCH", "false").lower() == "true"
+    
+    # ThreadedEmailService 스레드 풀 크기 (동시에 실행할 최대 Graph API 호출 수)
+    EMAIL_SERVICE_WORKERS = int(os.environ.get("EMAIL_SERVICE_WORKERS", "16"))
+    
     # 필터링 설정
     _FILTER_SENDERS = os.environ.get("FILTER_SENDERS", "block@krs.co.kr,Administrator")
     FILTER_SENDERS = [sender.strip() for sender in _FILTER_SENDERS.split(",") if sender.strip()]
     
+    # FILTER_SENDERS의 frozenset 캐시 (add/remove_filter_sender 호출 시 무효화)
+    _filter_senders_cache: Optional[FrozenSet[str]] = None
+    
     @classmethod
     def validate(cls) -> bool:
         """설정 유효성을 검사합니다.
@@ -135,6 +145,19 @@ class Config:
         """
         return cls.FILTER_SENDERS
     
+    @classmethod
+    def get_filter_senders_set(cls) -> FrozenSet[str]:
+        """필터링할 발신자 목록을 frozenset으로 반환합니다.
+        
+        목록이 바뀌기 전까지는 같은 frozenset 객체를 재사용합니다.
+        
+        Returns:
+            FrozenSet[str]: 필터링할 발신자 집합
+        """
+        if cls._filter_senders_cache is None:
+            cls._filter_senders_cache = frozenset(cls.FILTER_SENDERS)
+        return cls._filter_senders_cache
+    
     @classmethod
     def add_filter_sender(cls, sender: str) -> None:
         """필터링할 발신자를 추가합니다.
@@ -144,6 +167,7 @@ class Config:
         """
         if sender and sender not in cls.FILTER_SENDERS:
             cls.FILTER_SENDERS.append(sender)
+            cls._filter_senders_cache = None
             logger.debug(f"필터링할 발신자 추가: {sender}")
     
     @classmethod
@@ -158,6 +182,7 @@ class Config:
         """
         if sender in cls.FILTER_SENDERS:
             cls.FILTER_SENDERS.remove(sender)
+            cls._filter_senders_cache = None
             logger.debug(f"필터링할 발신자 제거: {sender}")
             return True
         return False
@@ -5,9 +5,16 @@
 
 import os
 import json
+import time
+from json import JSONDecodeError
 import requests
-from typing import Dict, List, Optional, Any, Tuple, Union
+from requests.adapters import HTTPAdapter
+from typing import Dict, Iterator, List, Optional, Any, Tuple, Union
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache, partial
+from dataclasses import replace
 from datetime import datetime, timedelta
+from urllib.parse import quote, urlencode
 
 from src.utils.logging_config import LoggerFactory
 from src.utils.exceptions import GraphApiError, DeltaLinkError
@@ -15,10 +22,110 @@ from src.infra.config import Config
 from src.infra.auth_token import AuthTokenManager
 from src.schemas.email import EmailDto, EmailFilter, EmailProcessingOptions
 
+try:
+    import orjson
+except ImportError:
+    # orjson이 설치되지 않은 경우 표준 json 모듈 사용
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    # httpx가 설치되지 않은 경우 requests 세션 사용
+    httpx = None
+
 
 # 로거 설정
 logger = LoggerFactory.get_logger(__name__)
 
+# 메시지 목록 조회 시 페이지당 메시지 수
+_PAGE_SIZE = 100
+
+# 델타 쿼리 한 번에 따라갈 최대 페이지 수 (나머지는 다음 조회에서 이어서 받음)
+_DELTA_MAX_PAGES = 10
+
+# JSON $batch 요청당 최대 하위 요청 수 (Graph API 제한)
+_BATCH_MAX_REQUESTS = 20
+
+# 요청 제한(429) 또는 일시적 오류(503) 응답 시 최대 재시도 횟수
+_MAX_RETRIES = 3
+
+# 재시도 대상 HTTP 상태 코드
+_RETRY_STATUS_CODES = (429, 503)
+
+# 멱등하지 않은 요청(POST)의 재시도 대상 상태 코드
+# (503은 요청이 이미 처리된 뒤에도 올 수 있으므로 재시도하면 메일이 중복 발송될 수 있음)
+_RETRY_STATUS_CODES_NON_IDEMPOTENT = (429,)
+
+# 같은 요청을 반복해도 결과가 같은 HTTP 메소드 (PATCH는 고정 값만 설정하는 용도로 사용)
+_IDEMPOTENT_METHODS = ("GET", "PATCH", "DELETE")
+
+# HTTP 연결 풀에 유지할 최대 연결 수 (병렬 페이지 조회 스레드 수 이상)
+_POOL_MAXSIZE = 20
+
+# HTTP 요청 제한 시간 (초)
+_REQUEST_TIMEOUT = 30.0
+
+# 네트워크 오류로 처리할 예외 타입
+_TRANSPORT_ERRORS = (requests.RequestException,) + ((httpx.HTTPError,) if httpx is not None else ())
+
+
+def _dumps(data: Dict[str, Any]) -> bytes:
+    """요청 본문을 JSON 바이트열로 직렬화합니다.
+    
+    orjson이 설치되어 있으면 orjson을, 없으면 표준 json 모듈을 사용합니다.
+    
+    Args:
+        data (Dict[str, Any]): 직렬화할 데이터
+        
+    Returns:
+        bytes: UTF-8로 인코딩된 JSON
+    """
+    if orjson is not None:
+        return orjson.dumps(data)
+    return json.dumps(data).encode("utf-8")
+
+
+def _parse_retry_after(value: Any) -> Optional[int]:
+    """Retry-After 헤더 값을 대기 시간(초)으로 변환합니다.
+    
+    HTTP 날짜나 소수 문자열처럼 정수 초가 아닌 값은 무시합니다.
+    
+    Args:
+        value (Any): Retry-After 헤더 값
+        
+    Returns:
+        Optional[int]: 대기 시간(초), 해석할 수 없으면 None
+    """
+    if isinstance(value, int):
+        return value
+    if isinstance(value, str) and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def _create_http_client() -> Any:
+    """Graph API 요청에 사용할 HTTP 클라이언트를 생성합니다.
+    
+    httpx가 설치되어 있으면 HTTP/2 연결 하나로 요청을 다중화하는 httpx.Client를,
+    없으면 연결을 재사용하는 requests.Session을 생성합니다.
+    
+    Returns:
+        Any: httpx.Client 또는 requests.Session
+    """
+    if httpx is not None:
+        limits = httpx.Limits(max_keepalive_connections=_POOL_MAXSIZE)
+        try:
+            return httpx.Client(http2=True, limits=limits, timeout=_REQUEST_TIMEOUT, follow_redirects=True)
+        except ImportError:
+            # h2 패키지가 없으면 HTTP/1.1 연결 풀 사용
+            logger.debug("h2 패키지가 없어 HTTP/1.1로 연결합니다.")
+            return httpx.Client(limits=limits, timeout=_REQUEST_TIMEOUT, follow_redirects=True)
+            
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_maxsize=_POOL_MAXSIZE))
+    return session
+
 
 class GraphApiGateway:
     """Graph API 게이트웨이 클래스
@@ -35,6 +142,7 @@ class GraphApiGateway:
         """
         self.auth_manager = auth_manager or AuthTokenManager()
         self.api_url = Config.get_api_url()
+        self.http_client = _create_http_client()
         logger.debug(f"GraphApiGateway 초기화 완료 (API URL: {self.api_url})")
     
     def get_me(self) -> Dict[str, Any]:
@@ -62,6 +170,28 @@ class GraphApiGateway:
         Returns:
             List[EmailDto]: 이메일 DTO 리스트
             
+        Raises:
+            GraphApiError: API 요청 실패 시
+        """
+        return list(self.iter_messages(filter_options, processing_options))
+    
+    def iter_messages(
+        self,
+        filter_options: EmailFilter,
+        processing_options: Optional[EmailProcessingOptions] = None
+    ) -> Iterator[EmailDto]:
+        """메시지를 페이지 단위로 조회하며 하나씩 반환합니다.
+        
+        @odata.nextLink를 따라 filter_options.limit개까지 조회하며,
+        메모리에는 한 페이지 분량의 메시지만 유지합니다.
+        
+        Args:
+            filter_options (EmailFilter): 필터 옵션
+            processing_options (Optional[EmailProcessingOptions], optional): 처리 옵션
+            
+        Yields:
+            EmailDto: 이메일 DTO
+            
         Raises:
             GraphApiError: API 요청 실패 시
         """
@@ -70,50 +200,196 @@ class GraphApiGateway:
             
         folder = filter_options.folder or "inbox"
         url = self._build_message_url(folder)
+        params = self._build_message_params(filter_options, processing_options)
+        params["$top"] = min(filter_options.limit, _PAGE_SIZE)
         
-        # 쿼리 파라미터 생성
-        params = {
-            "$top": filter_options.limit,
-            "$select": "id,subject,bodyPreview,body,from,toRecipients,ccRecipients,bccRecipients,receivedDateTime,sentDateTime,isRead,importance,hasAttachments,conversationId,categories"
-        }
+        remaining = filter_options.limit
+        while url and remaining > 0:
+            # API 요청 (nextLink에는 쿼리 파라미터가 이미 포함되어 있음)
+            response = self._request_with_backoff("GET", url, params=params)
+            
+            # 응답 처리
+            messages = response.get("value", [])[:remaining]
+            remaining -= len(messages)
+            logger.debug(f"{len(messages)}개의 메시지 조회됨")
+            
+            yield from self._to_email_dtos(messages, filter_options, processing_options)
+            
+            url = response.get("@odata.nextLink")
+            params = None
+    
+    def get_messages_parallel(
+        self,
+        filter_options: EmailFilter,
+        processing_options: Optional[EmailProcessingOptions] = None,
+        workers: int = 8,
+        page_size: int = _PAGE_SIZE
+    ) -> List[EmailDto]:
+        """메시지를 $skip 범위로 나누어 병렬로 조회합니다.
         
-        # OData 필터 추가
-        filter_query = filter_options.get_filter_query()
-        if filter_query:
-            params["$filter"] = filter_query
+        Args:
+            filter_options (EmailFilter): 필터 옵션
+            processing_options (Optional[EmailProcessingOptions], optional): 처리 옵션
+            workers (int, optional): 동시 요청 수. 기본값은 8.
+            page_size (int, optional): 요청당 메시지 수. 기본값은 100.
             
-        # 정렬 추가
-        if folder == "sentItems":
-            params["$orderby"] = "sentDateTime desc"
-        else:
-            params["$orderby"] = "receivedDateTime desc"
+        Returns:
+            List[EmailDto]: 이메일 DTO 리스트
+            
+        Raises:
+            GraphApiError: API 요청 실패 시
+        """
+        return list(self.iter_messages_parallel(filter_options, processing_options, workers, page_size))
+    
+    def iter_messages_parallel(
+        self,
+        filter_options: EmailFilter,
+        processing_options: Optional[EmailProcessingOptions] = None,
+        workers: int = 8,
+        page_size: int = _PAGE_SIZE
+    ) -> Iterator[EmailDto]:
+        """메시지를 $skip 범위로 나누어 병렬로 조회하며 하나씩 반환합니다.
         
-        # API 요청
-        response = self._make_request("GET", url, params=params)
+        $count로 전체 개수를 먼저 조회한 뒤 $top/$skip 범위 요청을 스레드 풀에서
+        동시에 수행하고, 결과는 정렬 순서대로 페이지 단위로 반환합니다.
+        요청 사이에 메일함이 바뀌면 $skip 범위가 밀려 메시지가 중복되거나 빠질 수
+        있으므로, 기본 조회는 iter_messages()를 사용하고 이 메서드는 변경이 드문
+        메일함을 대량으로 조회할 때만 사용합니다.
         
-        # 응답 처리
-        messages = response.get("value", [])
-        logger.debug(f"{len(messages)}개의 메시지 조회됨")
+        Args:
+            filter_options (EmailFilter): 필터 옵션
+            processing_options (Optional[EmailProcessingOptions], optional): 처리 옵션
+            workers (int, optional): 동시 요청 수. 기본값은 8.
+            page_size (int, optional): 요청당 메시지 수. 기본값은 100.
+            
+        Yields:
+            EmailDto: 이메일 DTO
+            
+        Raises:
+            GraphApiError: API 요청 실패 시
+        """
+        if processing_options is None:
+            processing_options = EmailProcessingOptions()
+            
+        folder = filter_options.folder or "inbox"
+        url = self._build_message_url(folder)
+        params = self._build_message_params(filter_options, processing_options)
         
-        # EmailDto 변환
-        email_dtos = []
+        # 전체 개수 조회 (응답 본문은 숫자)
+        count_params = {"$filter": params["$filter"]} if "$filter" in params else None
+        count = self._request_with_backoff("GET", f"{url}/$count", params=count_params)
+        total = min(int(count or 0), filter_options.limit)
         
-        for message in messages:
-            # 필터 적용
-            if processing_options.apply_filters:
-                sender = message.get("from", {}).get("emailAddress", {})
-                sender_email = sender.get("address", "")
-                sender_name = sender.get("name", "")
+        if total <= 0:
+            return
+            
+        # 범위별 쿼리 파라미터 생성
+        page_params = [
+            dict(params, **{"$top": min(page_size, total - skip), "$skip": skip})
+            for skip in range(0, total, page_size)
+        ]
+        logger.debug(f"병렬 페이지 조회: 전체 {total}개, {len(page_params)}개 요청")
+        
+        # executor.map은 제출 순서대로 결과를 반환하므로 정렬 순서가 유지됨
+        with ThreadPoolExecutor(max_workers=min(workers, len(page_params))) as executor:
+            pages = executor.map(
+                lambda page: self._request_with_backoff("GET", url, params=page).get("value", []),
+                page_params
+            )
+            try:
+                for messages in pages:
+                    logger.debug(f"{len(messages)}개의 메시지 조회됨")
+                    yield from self._to_email_dtos(messages, filter_options, processing_options)
+            finally:
+                # 소비자가 중간에 멈추면 아직 시작하지 않은 요청은 취소
+                pages.close()
+    
+    def batch_get_messages(
+        self,
+        filters: List[EmailFilter],
+        processing_options: Optional[EmailProcessingOptions] = None
+    ) -> List[List[EmailDto]]:
+        """여러 폴더의 메시지를 JSON $batch 요청 한 번으로 조회합니다.
+        
+        하위 요청이 429(요청 제한)로 응답하면 Retry-After 헤더만큼 대기한 뒤
+        해당 하위 요청만 다시 보냅니다. $batch 요청 자체가 429로 응답한 경우에는
+        _request_with_backoff()의 재시도 정책을 따릅니다.
+        
+        Args:
+            filters (List[EmailFilter]): 하위 요청별 필터 옵션 (최대 20개)
+            processing_options (Optional[EmailProcessingOptions], optional): 처리 옵션
+            
+        Returns:
+            List[List[EmailDto]]: filters와 같은 순서의 이메일 DTO 리스트
+            
+        Raises:
+            ValueError: 하위 요청 수가 $batch 한도를 넘는 경우
+            GraphApiError: API 요청 또는 하위 요청 실패 시
+        """
+        if processing_options is None:
+            processing_options = EmailProcessingOptions()
+            
+        if len(filters) > _BATCH_MAX_REQUESTS:
+            raise ValueError(f"$batch 요청은 최대 {_BATCH_MAX_REQUESTS}개까지 가능합니다: {len(filters)}개")
+            
+        # 하위 요청 생성 (id는 filters의 인덱스)
+        pending = {}
+        for index, filter_options in enumerate(filters):
+            folder = filter_options.folder or "inbox"
+            query = urlencode(self._build_message_params(filter_options, processing_options), safe="$,", quote_via=quote)
+            pending[str(index)] = {
+                "id": str(index),
+                "method": "GET",
+                "url": f"{self._build_message_url(folder)}?{query}"
+            }
+            
+        results: Dict[str, List[Dict[str, Any]]] = {}
+        
+        for attempt in range(_MAX_RETRIES + 1):
+            response = self._request_with_backoff("POST", "/$batch", json={"requests": list(pending.values())})
+            
+            retry_after = 0
+            for sub_response in response.get("responses", []):
+                request_id = sub_response.get("id")
+                status = sub_response.get("status", 500)
+                body = sub_response.get("body") or {}
                 
-                if filter_options.should_exclude_sender(sender_email, sender_name):
-                    logger.debug(f"필터링된 발신자: {sender_name} <{sender_email}>")
+                if status == 429:
+                    # 요청 제한: Retry-After 중 가장 긴 시간만큼 대기 후 재시도
+                    headers = sub_response.get("headers") or {}
+                    retry_after = max(retry_after, _parse_retry_after(headers.get("Retry-After")) or 1)
                     continue
+                    
+                if status >= 400:
+                    error_detail = body.get("error", {})
+                    error_msg = f"Graph API $batch 하위 요청 오류 (상태 코드: {status}): {error_detail.get('message', 'Unknown error')}"
+                    logger.error(error_msg)
+                    raise GraphApiError(
+                        error_msg,
+                        status_code=status,
+                        error_code=error_detail.get("code")
+                    )
+                    
+                results[request_id] = body.get("value", [])
+                pending.pop(request_id, None)
+                
+            if not pending:
+                break
+                
+            if attempt < _MAX_RETRIES:
+                logger.warning(f"$batch 하위 요청 {len(pending)}개 요청 제한(429), {retry_after}초 후 재시도")
+                time.sleep(retry_after)
+        else:
+            error_msg = f"$batch 하위 요청 재시도 횟수 초과: {len(pending)}개"
+            logger.error(error_msg)
+            raise GraphApiError(error_msg, status_code=429)
             
-            # DTO 변환
-            email_dto = EmailDto.from_dict(message, processing_options)
-            email_dtos.append(email_dto)
+        logger.debug(f"$batch 조회 완료: {len(filters)}개 하위 요청")
         
-        return email_dtos
+        return [
+            self._to_email_dtos(results[str(index)], filter_options, processing_options)
+            for index, filter_options in enumerate(filters)
+        ]
     
     def get_message(
         self,
@@ -143,7 +419,7 @@ class GraphApiGateway:
             expand = "attachments"
             
         # API 요청
-        response = self._make_request("GET", url, expand=expand)
+        response = self._request_with_backoff("GET", url, expand=expand)
         
         # EmailDto 변환
         return EmailDto.from_dict(response, processing_options)
@@ -169,37 +445,123 @@ class GraphApiGateway:
         if processing_options is None:
             processing_options = EmailProcessingOptions()
             
-        # 델타 링크 로드
-        delta_key = f"{folder}_delta"
-        delta_link = Config.get_delta_link(delta_key)
+        delta_key = self._build_delta_key(folder, processing_options)
+        data = self._fetch_delta_page(folder, delta_key, processing_options, restart_expired=True)
         
-        if delta_link:
-            # 기존 델타 링크가 있는 경우
-            logger.debug(f"기존 델타 링크 사용: {delta_key}")
-            response = requests.get(delta_link, headers=self._get_headers())
+        # 응답 처리
+        return self._process_delta_response(data, delta_key, processing_options)
+    
+    def iter_delta_messages(
+        self,
+        folder: str = "inbox",
+        processing_options: Optional[EmailProcessingOptions] = None,
+        restart_expired: bool = True,
+        max_pages: Optional[int] = _DELTA_MAX_PAGES
+    ) -> Iterator[EmailDto]:
+        """델타 쿼리로 변경된 메시지를 페이지 단위로 조회하며 하나씩 반환합니다.
+        
+        @odata.nextLink를 따라 최대 max_pages 페이지까지 조회합니다. 마지막 페이지의
+        @odata.deltaLink는 다음 조회를 위해 저장되며, 페이지 한도에 도달하면
+        @odata.nextLink를 대신 저장하여 다음 조회가 이어서 받도록 합니다.
+        
+        Args:
+            folder (str, optional): 폴더. 기본값은 "inbox".
+            processing_options (Optional[EmailProcessingOptions], optional): 처리 옵션
+            restart_expired (bool, optional): 저장된 델타 링크가 만료(410)된 경우 새 델타 쿼리를
+                시작할지 여부. False이면 델타 링크만 초기화하고 GraphApiError를 발생시킵니다.
+                기본값은 True.
+            max_pages (Optional[int], optional): 조회할 최대 페이지 수. None이면 마지막 페이지까지.
+                기본값은 10.
             
-            if response.status_code != 200:
-                # 델타 링크 만료 등으로 오류 발생 시 초기화
-                logger.warning(f"델타 링크 오류 (상태 코드: {response.status_code}), 초기화 후 재시도")
-                Config.reset_delta_link(delta_key)
-                return self.get_delta_messages(folder, processing_options)
+        Yields:
+            EmailDto: 이메일 DTO
+            
+        Raises:
+            GraphApiError: API 요청 실패 시
+            DeltaLinkError: 델타 링크 처리 오류 시
+        """
+        for emails, _ in self._iter_delta_pages(folder, processing_options, restart_expired, max_pages):
+            yield from emails
+    
+    def get_delta_changes(
+        self,
+        folder: str = "inbox",
+        processing_options: Optional[EmailProcessingOptions] = None,
+        restart_expired: bool = True,
+        max_pages: Optional[int] = _DELTA_MAX_PAGES
+    ) -> Tuple[List[EmailDto], Optional[str]]:
+        """델타 쿼리로 변경된 메시지를 최대 max_pages 페이지까지 조회합니다.
+        
+        Args:
+            folder (str, optional): 폴더. 기본값은 "inbox".
+            processing_options (Optional[EmailProcessingOptions], optional): 처리 옵션
+            restart_expired (bool, optional): 저장된 델타 링크가 만료(410)된 경우 새 델타 쿼리를
+                시작할지 여부. 기본값은 True.
+            max_pages (Optional[int], optional): 조회할 최대 페이지 수. None이면 마지막 페이지까지.
+                기본값은 10.
+            
+        Returns:
+            Tuple[List[EmailDto], Optional[str]]:
+                이메일 DTO 리스트와, 페이지 한도로 중단된 경우 이어서 조회할 @odata.nextLink
+                (모두 조회했으면 None). nextLink는 저장되므로 다음 조회가 자동으로 이어서 받습니다.
                 
-            data = response.json()
-        else:
-            # 새로운 델타 쿼리 시작
-            url = self._build_message_url(folder)
+        Raises:
+            GraphApiError: API 요청 실패 시
+            DeltaLinkError: 델타 링크 처리 오류 시
+        """
+        emails: List[EmailDto] = []
+        resume_link = None
+        for page_emails, resume_link in self._iter_delta_pages(folder, processing_options, restart_expired, max_pages):
+            emails.extend(page_emails)
+        return emails, resume_link
+    
+    def _iter_delta_pages(
+        self,
+        folder: str,
+        processing_options: Optional[EmailProcessingOptions],
+        restart_expired: bool,
+        max_pages: Optional[int]
+    ) -> Iterator[Tuple[List[EmailDto], Optional[str]]]:
+        """델타 쿼리 결과를 페이지 단위로 반환합니다.
+        
+        Args:
+            folder (str): 폴더
+            processing_options (Optional[EmailProcessingOptions]): 처리 옵션
+            restart_expired (bool): 델타 링크 만료(410) 시 새 델타 쿼리를 시작할지 여부
+            max_pages (Optional[int]): 조회할 최대 페이지 수 (None이면 제한 없음)
             
-            # 쿼리 파라미터 생성
-            params = {
-                "$delta": "",
-                "$select": "id,subject,bodyPreview,body,from,toRecipients,ccRecipients,bccRecipients,receivedDateTime,sentDateTime,isRead,importance,hasAttachments,conversationId,categories"
-            }
+        Yields:
+            Tuple[List[EmailDto], Optional[str]]:
+                페이지의 이메일 DTO 리스트와, 페이지 한도로 중단한 마지막 페이지이면 이어서 조회할 nextLink
+                
+        Raises:
+            GraphApiError: API 요청 실패 시
+            DeltaLinkError: 델타 링크 처리 오류 시
+        """
+        if processing_options is None:
+            processing_options = EmailProcessingOptions()
             
-            # API 요청
-            data = self._make_request("GET", url, params=params)
+        delta_key = self._build_delta_key(folder, processing_options)
+        data = self._fetch_delta_page(folder, delta_key, processing_options, restart_expired)
+        pages = 1
         
-        # 응답 처리
-        return self._process_delta_response(data, delta_key, processing_options)
+        while True:
+            emails, _ = self._process_delta_response(data, delta_key, processing_options)
+            
+            next_link = data.get("@odata.nextLink")
+            if next_link and max_pages is not None and pages >= max_pages:
+                # 페이지 한도 도달: 다음 조회가 이어서 받도록 nextLink를 델타 링크 대신 저장
+                Config.save_delta_link(delta_key, next_link)
+                logger.info(f"델타 쿼리 페이지 한도({max_pages}) 도달, 다음 조회에서 이어서 조회: {delta_key}")
+                yield emails, next_link
+                return
+                
+            yield emails, None
+            
+            if not next_link:
+                return
+            data = self._request_with_backoff("GET", next_link)
+            pages += 1
     
     def mark_as_read(self, message_id: str) -> bool:
         """메시지를 읽음으로 표시합니다.
@@ -221,7 +583,7 @@ class GraphApiGateway:
         }
         
         # API 요청
-        self._make_request("PATCH", url, json=body)
+        self._request_with_backoff("PATCH", url, json=body)
         logger.debug(f"메시지 읽음으로 표시됨: {message_id}")
         return True
     
@@ -241,12 +603,12 @@ class GraphApiGateway:
         
         # 요청 본문
         body = {
-            "message": email.to_dict(),
+            "message": email.to_graph_payload(),
             "saveToSentItems": True
         }
         
         # API 요청
-        self._make_request("POST", url, json=body)
+        self._request_with_backoff("POST", url, json=body)
         logger.debug(f"메시지 발송 완료: {email.subject}")
         return True
     
@@ -282,24 +644,18 @@ class GraphApiGateway:
         params = {
             "$search": f'"{search_term}"',
             "$top": 50,
-            "$select": "id,subject,bodyPreview,body,from,toRecipients,ccRecipients,bccRecipients,receivedDateTime,sentDateTime,isRead,importance,hasAttachments,conversationId,categories"
+            "$select": processing_options.select_fields
         }
         
         # API 요청
-        response = self._make_request("GET", url, params=params)
+        response = self._request_with_backoff("GET", url, params=params)
         
         # 응답 처리
         messages = response.get("value", [])
         logger.debug(f"검색 결과: {len(messages)}개의 메시지 찾음")
         
         # EmailDto 변환
-        email_dtos = []
-        
-        for message in messages:
-            email_dto = EmailDto.from_dict(message, processing_options)
-            email_dtos.append(email_dto)
-        
-        return email_dtos
+        return EmailDto.from_list(messages, processing_options)
     
     def _make_request(
         self,
@@ -349,21 +705,24 @@ class GraphApiGateway:
                 params = {}
             params["$expand"] = expand
             
+        # 요청 본문 직렬화
+        data = _dumps(json) if json is not None else None
+            
         try:
             # API 요청 수행
             logger.debug(f"API 요청: {method} {url}")
             
-            if method == "GET":
-                response = requests.get(url, headers=headers, params=params)
-            elif method == "POST":
-                response = requests.post(url, headers=headers, params=params, json=json)
-            elif method == "PATCH":
-                response = requests.patch(url, headers=headers, params=params, json=json)
-            elif method == "DELETE":
-                response = requests.delete(url, headers=headers, params=params)
-            else:
+            if method not in ("GET", "POST", "PATCH", "DELETE"):
                 raise ValueError(f"지원하지 않는 HTTP 메소드: {method}")
                 
+            # 연결 풀의 연결을 재사용 (httpx는 본문을 content, requests는 data로 전달)
+            if httpx is not None and isinstance(self.http_client, httpx.Client):
+                response = self.http_client.request(method, url, headers=headers, params=params, content=data)
+            else:
+                response = self.http_client.request(
+                    method, url, headers=headers, params=params, data=data, timeout=_REQUEST_TIMEOUT
+                )
+                
             # 응답 확인
             if response.status_code >= 400:
                 error_data = response.json() if response.text else {}
@@ -376,7 +735,8 @@ class GraphApiGateway:
                     error_msg,
                     status_code=response.status_code,
                     error_code=error_detail.get("code"),
-                    request_id=response.headers.get("request-id")
+                    request_id=response.headers.get("request-id"),
+                    retry_after=_parse_retry_after(response.headers.get("Retry-After"))
                 )
                 
             # JSON 응답 파싱
@@ -384,22 +744,56 @@ class GraphApiGateway:
                 return response.json()
             return {}
             
-        except requests.RequestException as e:
-            logger.exception("API 요청 중 네트워크 오류 발생")
-            raise GraphApiError(f"API 요청 중 네트워크 오류 발생: {str(e)}")
+        except GraphApiError:
+            # 이미 로깅 및 변환된 오류
+            raise
             
-        except json.JSONDecodeError as e:
+        except JSONDecodeError as e:
+            # json 파라미터가 json 모듈을 가리므로 모듈 수준에서 가져온 이름을 사용
+            # (requests의 JSONDecodeError는 RequestException이기도 하므로 먼저 처리)
             logger.exception("API 응답 JSON 파싱 오류 발생")
             raise GraphApiError(f"API 응답 JSON 파싱 오류 발생: {str(e)}")
             
-        except GraphApiError:
-            # 이미 로깅 및 변환된 오류
-            raise
+        except _TRANSPORT_ERRORS as e:
+            logger.exception("API 요청 중 네트워크 오류 발생")
+            raise GraphApiError(f"API 요청 중 네트워크 오류 발생: {str(e)}")
             
         except Exception as e:
             logger.exception("API 요청 중 예기치 않은 오류 발생")
             raise GraphApiError(f"API 요청 중 예기치 않은 오류 발생: {str(e)}")
     
+    def _request_with_backoff(self, method: str, endpoint: str, **kwargs) -> Any:
+        """요청 제한(429)과 일시적 오류(503)를 재시도하며 API 요청을 수행합니다.
+        
+        Retry-After 헤더가 있으면 그 시간만큼, 없으면 1, 2, 4초로 늘려가며 대기합니다.
+        멱등하지 않은 요청(POST)은 처리되지 않은 것이 확실한 429만 재시도합니다.
+        
+        Args:
+            method (str): HTTP 메소드
+            endpoint (str): API 엔드포인트
+            **kwargs: _make_request()에 전달할 인자
+            
+        Returns:
+            Any: API 응답
+            
+        Raises:
+            GraphApiError: API 요청 실패 또는 재시도 횟수 초과 시
+        """
+        if method in _IDEMPOTENT_METHODS:
+            retry_status_codes = _RETRY_STATUS_CODES
+        else:
+            retry_status_codes = _RETRY_STATUS_CODES_NON_IDEMPOTENT
+            
+        for attempt in range(_MAX_RETRIES + 1):
+            try:
+                return self._make_request(method, endpoint, **kwargs)
+            except GraphApiError as e:
+                if e.status_code not in retry_status_codes or attempt == _MAX_RETRIES:
+                    raise
+                delay = e.retry_after or 2 ** attempt
+                logger.warning(f"요청 제한 (상태 코드: {e.status_code}), {delay}초 후 재시도: {method} {endpoint}")
+                time.sleep(delay)
+    
     def _get_headers(self, access_token: Optional[str] = None) -> Dict[str, str]:
         """API 요청 헤더를 생성합니다.
         
@@ -437,6 +831,174 @@ class GraphApiGateway:
         else:
             return f"/me/mailFolders/{folder}/messages"
     
+    def _build_delta_key(self, folder: str, processing_options: EmailProcessingOptions) -> str:
+        """델타 링크 저장 키를 생성합니다.
+        
+        델타 링크에는 처음 요청한 $select가 들어 있으므로, 본문을 요청하는 조회와
+        메타데이터만 요청하는 조회가 서로의 델타 링크와 변경사항을 가져가지 않도록
+        본문 요청 여부별로 따로 저장합니다.
+        
+        Args:
+            folder (str): 폴더
+            processing_options (EmailProcessingOptions): 처리 옵션 ($select 결정)
+            
+        Returns:
+            str: 델타 링크 키 (예: "inbox_delta_full", "inbox_delta_meta")
+        """
+        scope = "full" if processing_options.requests_body else "meta"
+        return f"{folder}_delta_{scope}"
+    
+    def _build_message_params(
+        self,
+        filter_options: EmailFilter,
+        processing_options: EmailProcessingOptions
+    ) -> Dict[str, Any]:
+        """메시지 목록 조회용 쿼리 파라미터를 생성합니다.
+        
+        Args:
+            filter_options (EmailFilter): 필터 옵션
+            processing_options (EmailProcessingOptions): 처리 옵션 ($select 결정)
+            
+        Returns:
+            Dict[str, Any]: 쿼리 파라미터
+        """
+        params = {
+            "$top": filter_options.limit,
+            "$select": processing_options.select_fields
+        }
+        
+        # OData 필터 추가
+        filter_query = filter_options.get_filter_query()
+        if filter_query:
+            params["$filter"] = filter_query
+            
+        # 정렬 추가
+        if filter_options.folder == "sentItems":
+            params["$orderby"] = "sentDateTime desc"
+        else:
+            params["$orderby"] = "receivedDateTime desc"
+            
+        return params
+    
+    def _to_email_dtos(
+        self,
+        messages: List[Dict[str, Any]],
+        filter_options: EmailFilter,
+        processing_options: EmailProcessingOptions
+    ) -> List[EmailDto]:
+        """발신자 필터를 적용하고 메시지를 EmailDto로 변환합니다.
+        
+        Args:
+            messages (List[Dict[str, Any]]): Graph API 메시지 목록
+            filter_options (EmailFilter): 필터 옵션
+            processing_options (EmailProcessingOptions): 처리 옵션
+            
+        Returns:
+            List[EmailDto]: 이메일 DTO 리스트
+        """
+        # 필터 적용
+        if processing_options.apply_filters:
+            filtered_messages = []
+            
+            for message in messages:
+                sender = message.get("from", {}).get("emailAddress", {})
+                sender_email = sender.get("address", "")
+                sender_name = sender.get("name", "")
+                
+                if filter_options.should_exclude_sender(sender_email, sender_name):
+                    logger.debug(f"필터링된 발신자: {sender_name} <{sender_email}>")
+                    continue
+                    
+                filtered_messages.append(message)
+                
+            messages = filtered_messages
+        
+        # EmailDto 변환
+        emails = EmailDto.from_list(messages, processing_options)
+        
+        # 미리보기만 조회한 경우 전체 본문은 EmailDto.full_body 접근 시 메시지별로 조회
+        if processing_options.body_preview_only:
+            body_loader = partial(
+                self._get_message_body,
+                processing_options=replace(processing_options, body_preview_only=False)
+            )
+            for email in emails:
+                email._body_loader = body_loader
+                
+        return emails
+    
+    def _get_message_body(
+        self,
+        message_id: str,
+        processing_options: EmailProcessingOptions
+    ) -> EmailDto:
+        """메시지의 본문만 조회합니다.
+        
+        Args:
+            message_id (str): 메시지 ID
+            processing_options (EmailProcessingOptions): 처리 옵션
+            
+        Returns:
+            EmailDto: 본문만 채워진 이메일 DTO
+            
+        Raises:
+            GraphApiError: API 요청 실패 시
+        """
+        response = self._request_with_backoff("GET", f"/me/messages/{message_id}", params={"$select": "body"})
+        return EmailDto.from_dict(response, processing_options)
+    
+    def _fetch_delta_page(
+        self,
+        folder: str,
+        delta_key: str,
+        processing_options: EmailProcessingOptions,
+        restart_expired: bool
+    ) -> Dict[str, Any]:
+        """델타 쿼리의 첫 페이지를 조회합니다.
+        
+        저장된 델타 링크가 있으면 이어서 조회하고, 없으면 새 델타 쿼리를 시작합니다.
+        
+        Args:
+            folder (str): 폴더
+            delta_key (str): 델타 링크 키
+            processing_options (EmailProcessingOptions): 처리 옵션 ($select 결정)
+            restart_expired (bool): 델타 링크 만료(410) 시 새 델타 쿼리를 시작할지 여부
+            
+        Returns:
+            Dict[str, Any]: API 응답
+            
+        Raises:
+            GraphApiError: API 요청 실패 시, 또는 restart_expired가 False인데 델타 링크가 만료된 경우
+        """
+        # 델타 링크 로드
+        delta_link = Config.get_delta_link(delta_key)
+        
+        if delta_link:
+            # 기존 델타 링크가 있는 경우 (인증 헤더가 필요하므로 게이트웨이 요청 메서드 사용)
+            logger.debug(f"기존 델타 링크 사용: {delta_key}")
+            try:
+                return self._request_with_backoff("GET", delta_link)
+            except GraphApiError as e:
+                if e.status_code != 410:
+                    raise
+                    
+                # 델타 토큰 만료(410 Gone): 델타 링크 초기화
+                logger.warning(f"델타 링크 만료 (상태 코드: 410), 초기화: {delta_key}")
+                Config.reset_delta_link(delta_key)
+                if not restart_expired:
+                    raise
+                    
+        # 새로운 델타 쿼리 시작
+        url = f"{self._build_message_url(folder)}/delta"
+        
+        # 쿼리 파라미터 생성
+        params = {
+            "$select": processing_options.select_fields
+        }
+        
+        # API 요청
+        return self._request_with_backoff("GET", url, params=params)
+    
     def _process_delta_response(
         self,
         response: Dict[str, Any],
@@ -462,18 +1024,11 @@ class GraphApiGateway:
             messages = response.get("value", [])
             logger.debug(f"델타 쿼리 결과: {len(messages)}개의 변경사항")
             
-            # EmailDto 변환
-            email_dtos = []
-            
-            for message in messages:
-                # 삭제된 메시지 처리
-                if "@removed" in message:
-                    # 삭제 이벤트는 현재 처리하지 않음
-                    continue
-                    
-                # DTO 변환
-                email_dto = EmailDto.from_dict(message, processing_options)
-                email_dtos.append(email_dto)
+            # EmailDto 변환 (삭제 이벤트는 현재 처리하지 않음)
+            email_dtos = EmailDto.from_list(
+                [message for message in messages if "@removed" not in message],
+                processing_options
+            )
             
             # 다음 델타 링크 추출
             next_link = None
@@ -495,3 +1050,16 @@ class GraphApiGateway:
         except Exception as e:
             logger.exception("델타 응답 처리 중 오류 발생")
             raise DeltaLinkError(f"델타 응답 처리 중 오류 발생: {str(e)}")
+
+
+@lru_cache(maxsize=1)
+def get_default_gateway() -> GraphApiGateway:
+    """프로세스 전체에서 공유하는 기본 GraphApiGateway를 반환합니다.
+    
+    처음 호출될 때 한 번만 생성하므로 인증 토큰 캐시 로드와 MSAL 애플리케이션
+    초기화를 서비스 인스턴스마다 반복하지 않습니다.
+    
+    Returns:
+        GraphApiGateway: 공유 게이트웨이 인스턴스
+    """
+    return GraphApiGateway()
@@ -4,7 +4,7 @@
 """
 
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime
 
 
@@ -174,13 +174,13 @@ class AuthStatus:
     Attributes:
         is_authenticated (bool): 인증되었는지 여부
         user_info (Optional[UserInfo]): 인증된 사용자 정보 (인증되지 않은 경우 None)
-        scopes (List[str]): 허용된 권한 범위
+        scopes (Tuple[str, ...]): 허용된 권한 범위
         token_expires_at (Optional[datetime]): 토큰 만료 일시 (인증되지 않은 경우 None)
         auth_method (Optional[str]): 인증 방법 (인증되지 않은 경우 None)
     """
     
     is_authenticated: bool
-    scopes: List[str] = field(default_factory=list)
+    scopes: Tuple[str, ...] = ()
     user_info: Optional[UserInfo] = None
     token_expires_at: Optional[datetime] = None
     auth_method: Optional[str] = None
@@ -3,16 +3,21 @@
 이 모듈은 이메일 관련 데이터 클래스를 정의합니다.
 """
 
+import re
+import sys
+import threading
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Any, Union
-from datetime import datetime
+from functools import cached_property, lru_cache
+from typing import AbstractSet, Dict, List, Optional, Any, Tuple, Union
+from datetime import datetime, timezone
 
 
-@dataclass
+@dataclass(frozen=True)
 class EmailParticipant:
     """이메일 참여자 클래스
     
     이메일 발신자 또는 수신자 정보를 포함하는 데이터 클래스입니다.
+    불변 객체이므로 값을 바꿀 때는 dataclasses.replace()로 새 객체를 생성합니다.
     
     Attributes:
         email (str): 이메일 주소
@@ -42,90 +47,144 @@ class EmailParticipant:
             type=participant_type
         )
     
-    def to_dict(self) -> Dict[str, Any]:
-        """EmailParticipant 객체를 딕셔너리로 변환합니다.
-        
-        Returns:
-            Dict[str, Any]: 변환된 딕셔너리
-        """
+    @cached_property
+    def _dict(self) -> Dict[str, Any]:
+        """Graph API 형식의 딕셔너리 (최초 접근 시 한 번만 생성)"""
         return {
             "emailAddress": {
                 "address": self.email,
                 "name": self.name
             }
         }
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """EmailParticipant 객체를 딕셔너리로 변환합니다.
+        
+        객체가 불변이므로 한 번 생성한 딕셔너리를 재사용합니다.
+        반환된 딕셔너리는 수정하지 않아야 합니다.
+        
+        Returns:
+            Dict[str, Any]: 변환된 딕셔너리
+        """
+        return self._dict
 
 
-@dataclass
+def _iso_z(value: datetime) -> str:
+    """datetime을 OData 필터용 UTC ISO 8601 문자열('YYYY-MM-DDTHH:MM:SSZ')로 변환합니다.
+    
+    타임존이 없는 datetime은 UTC로 간주하고, 타임존이 있으면 UTC로 변환합니다.
+    문자열 검사나 strftime 없이 필드 값으로 직접 포맷합니다.
+    
+    Args:
+        value (datetime): 변환할 날짜
+        
+    Returns:
+        str: UTC ISO 8601 문자열
+    """
+    if value.tzinfo is not None:
+        value = value.astimezone(timezone.utc)
+    return "%04d-%02d-%02dT%02d:%02d:%02dZ" % (
+        value.year, value.month, value.day, value.hour, value.minute, value.second
+    )
+
+
+def _parse_datetime(value: Optional[Union[datetime, str]]) -> Optional[datetime]:
+    """ISO 8601 형식 문자열을 datetime으로 변환합니다.
+    
+    Args:
+        value (Optional[Union[datetime, str]]): datetime 객체 또는 ISO 8601 형식 문자열
+            (예: '2025-03-01T00:00:00Z')
+        
+    Returns:
+        Optional[datetime]: 변환된 datetime, 값이 없거나 빈 문자열이면 None
+        
+    Raises:
+        ValueError: ISO 8601 형식이 아닌 문자열인 경우
+    """
+    if not isinstance(value, str):
+        return value
+    if not value:
+        return None
+    return _parse_iso(value)
+
+
+@lru_cache(maxsize=256)
+def _parse_iso(value: str) -> datetime:
+    """ISO 8601 형식 문자열을 datetime으로 변환합니다.
+    
+    조회 기간 경계처럼 같은 문자열이 반복해서 전달되므로 결과를 캐시합니다.
+    (datetime은 불변 객체이므로 공유해도 안전)
+    
+    Args:
+        value (str): ISO 8601 형식 문자열 (예: '2025-03-01T00:00:00Z')
+        
+    Returns:
+        datetime: 변환된 datetime
+        
+    Raises:
+        ValueError: ISO 8601 형식이 아닌 문자열인 경우
+    """
+    if value.endswith("Z"):
+        value = value[:-1] + "+00:00"
+    return datetime.fromisoformat(value)
+
+
+@dataclass(frozen=True)
 class EmailFilter:
     """이메일 필터 클래스
     
     이메일 필터링 옵션을 포함하는 데이터 클래스입니다.
+    불변 객체이므로 값을 바꿀 때는 dataclasses.replace()로 새 객체를 생성합니다.
     
     Attributes:
-        start_date (Optional[Union[datetime, str]]): 시작 날짜 (datetime 객체 또는 ISO 8601 형식 문자열)
-        end_date (Optional[Union[datetime, str]]): 종료 날짜 (datetime 객체 또는 ISO 8601 형식 문자열)
+        start_date (Optional[datetime]): 시작 날짜 (ISO 8601 형식 문자열로 전달하면 datetime으로 변환)
+        end_date (Optional[datetime]): 종료 날짜 (ISO 8601 형식 문자열로 전달하면 datetime으로 변환)
         folder (Optional[str]): 폴더 (예: 'inbox', 'sentItems')
         limit (int): 최대 결과 수
         search_query (Optional[str]): 검색 쿼리
-        exclude_senders (List[str]): 제외할 발신자 목록
+        exclude_senders (AbstractSet[str]): 제외할 발신자 집합 (소문자 frozenset으로 정규화)
         only_unread (bool): 읽지 않은 메일만 포함할지 여부
     """
     
-    start_date: Optional[Union[datetime, str]] = None
-    end_date: Optional[Union[datetime, str]] = None
+    start_date: Optional[datetime] = None
+    end_date: Optional[datetime] = None
     folder: Optional[str] = None
     limit: int = 50
     search_query: Optional[str] = None
-    exclude_senders: List[str] = field(default_factory=list)
+    exclude_senders: AbstractSet[str] = frozenset()
     only_unread: bool = False
     
+    def __post_init__(self):
+        """ISO 8601 문자열로 전달된 날짜를 datetime으로 변환하고 제외 발신자를 정규화합니다."""
+        # frozen 데이터 클래스이므로 object.__setattr__로 설정
+        object.__setattr__(self, "start_date", _parse_datetime(self.start_date))
+        object.__setattr__(self, "end_date", _parse_datetime(self.end_date))
+        # 메시지마다 lower()를 반복하지 않도록 소문자 frozenset으로 한 번만 변환
+        object.__setattr__(
+            self, "exclude_senders", frozenset(sender.lower() for sender in self.exclude_senders)
+        )
+    
     def get_filter_query(self) -> Optional[str]:
         """OData 필터 쿼리를 생성합니다.
         
         Returns:
             Optional[str]: OData 필터 쿼리 문자열, 필터가 없으면 None
         """
+        field_name = "sentDateTime" if self.folder == "sentItems" else "receivedDateTime"
+        
+        # 가장 흔한 경우(시작/종료 날짜만 지정)는 바로 생성
+        if self.start_date is not None and self.end_date is not None and not self.only_unread:
+            return (f"{field_name} ge {_iso_z(self.start_date)} "
+                    f"and {field_name} le {_iso_z(self.end_date)}")
+        
         filters = []
         
         # 날짜 필터
-        if self.start_date:
-            # 문자열 또는 datetime 객체 처리
-            if isinstance(self.start_date, str):
-                # 이미 문자열이면 그대로 사용
-                start_date_str = self.start_date
-            else:
-                # datetime 객체면 ISO 형식으로 변환
-                start_date_str = self.start_date.isoformat()
-                # 이미 타임존 정보가 있으면 그대로 사용, 없으면 Z 추가
-                if start_date_str.endswith('+00:00'):
-                    start_date_str = start_date_str.replace('+00:00', 'Z')
-                elif '+' not in start_date_str and '-' not in start_date_str[10:]:
-                    start_date_str += 'Z'
-                
-            if self.folder == "sentItems":
-                filters.append(f"sentDateTime ge {start_date_str}")
-            else:
-                filters.append(f"receivedDateTime ge {start_date_str}")
-        
-        if self.end_date:
-            # 문자열 또는 datetime 객체 처리
-            if isinstance(self.end_date, str):
-                # 이미 문자열이면 그대로 사용
-                end_date_str = self.end_date
-            else:
-                # datetime 객체면 ISO 형식으로 변환
-                end_date_str = self.end_date.isoformat()
-                # 이미 타임존 정보가 있으면 그대로 사용, 없으면 Z 추가
-                if end_date_str.endswith('+00:00'):
-                    end_date_str = end_date_str.replace('+00:00', 'Z')
-                elif '+' not in end_date_str and '-' not in end_date_str[10:]:
-                    end_date_str += 'Z'
-                
-            if self.folder == "sentItems":
-                filters.append(f"sentDateTime le {end_date_str}")
-            else:
-                filters.append(f"receivedDateTime le {end_date_str}")
+        if self.start_date is not None:
+            filters.append(f"{field_name} ge {_iso_z(self.start_date)}")
+        
+        if self.end_date is not None:
+            filters.append(f"{field_name} le {_iso_z(self.end_date)}")
         
         # 읽지 않은 메일만 필터링
         if self.only_unread:
@@ -146,29 +205,76 @@ class EmailFilter:
         Returns:
             bool: 제외해야 하면 True, 아니면 False
         """
-        for exclude in self.exclude_senders:
-            if exclude.lower() in email.lower() or exclude.lower() in name.lower():
-                return True
-        return False
+        if not self.exclude_senders:
+            return False
+            
+        email = email.lower()
+        name = name.lower()
+        
+        # 정확히 일치하는 경우는 해시 조회로 바로 판정
+        if email in self.exclude_senders or name in self.exclude_senders:
+            return True
+            
+        # 부분 일치 (도메인, 이름 일부 등)
+        return any(exclude in email or exclude in name for exclude in self.exclude_senders)
 
 
-@dataclass
+# 메시지 조회 시 요청하는 필드 (EmailDto.from_dict()에서 사용하는 필드)
+_MESSAGE_FIELDS = (
+    "id", "subject", "bodyPreview", "body", "from", "toRecipients", "ccRecipients",
+    "bccRecipients", "receivedDateTime", "sentDateTime", "isRead", "importance",
+    "hasAttachments", "conversationId", "categories",
+)
+_SELECT_FULL = ",".join(_MESSAGE_FIELDS)
+_SELECT_METADATA = ",".join(name for name in _MESSAGE_FIELDS if name != "body")
+
+
+@dataclass(frozen=True)
 class EmailProcessingOptions:
     """이메일 처리 옵션 클래스
     
     이메일 처리 방법을 정의하는 데이터 클래스입니다.
+    불변 객체이므로 같은 옵션의 인스턴스를 여러 요청에서 공유할 수 있습니다.
     
     Attributes:
         convert_html_to_text (bool): HTML 본문을 텍스트로 변환할지 여부
         apply_filters (bool): 필터를 적용할지 여부
         include_body (bool): 본문을 포함할지 여부
         include_attachments (bool): 첨부 파일을 포함할지 여부
+        keep_raw (bool): EmailDto에 Graph API 원본 응답(raw_data)을 보관할지 여부
+        body_preview_only (bool): 본문 대신 bodyPreview만 조회할지 여부.
+            전체 본문은 EmailDto.full_body에 처음 접근할 때 메시지별로 조회합니다.
     """
     
     convert_html_to_text: bool = True
     apply_filters: bool = True
     include_body: bool = True
     include_attachments: bool = False
+    keep_raw: bool = False
+    body_preview_only: bool = False
+    
+    @property
+    def requests_body(self) -> bool:
+        """Graph API에 본문(body) 필드를 요청하는지 여부를 반환합니다.
+        
+        Returns:
+            bool: include_body가 True이고 body_preview_only가 False이면 True
+        """
+        return self.include_body and not self.body_preview_only
+    
+    @property
+    def select_fields(self) -> str:
+        """Graph API $select 쿼리 값을 반환합니다.
+        
+        include_body가 False이거나 body_preview_only가 True이면
+        body를 제외한 메타데이터 필드(bodyPreview 포함)만 요청합니다.
+        
+        Returns:
+            str: 쉼표로 구분된 필드 목록
+        """
+        if self.requests_body:
+            return _SELECT_FULL
+        return _SELECT_METADATA
 
 
 @dataclass
@@ -215,11 +321,165 @@ class EmailAttachment:
         )
 
 
+# 본문 유형 값 (identity 비교를 위해 intern)
+_HTML = sys.intern("html")
+_TEXT = sys.intern("text")
+
+# 스레드별 html2text 변환기 (생성 비용을 이메일마다 반복하지 않도록 재사용)
+_h2t_local = threading.local()
+
+
+def _get_h2t():
+    """현재 스레드의 html2text 변환기를 반환합니다.
+    
+    HTML2Text 객체는 handle() 호출마다 내부 상태를 초기화하므로 재사용할 수 있지만,
+    파싱 중 상태를 가지므로 스레드 간에는 공유하지 않습니다.
+    
+    Returns:
+        html2text.HTML2Text: 설정이 적용된 변환기
+        
+    Raises:
+        ImportError: html2text가 설치되지 않은 경우
+    """
+    h = getattr(_h2t_local, "h", None)
+    if h is None:
+        import html2text
+        h = html2text.HTML2Text()
+        h.ignore_links = False
+        h.ignore_images = True
+        _h2t_local.h = h
+    return h
+
+
+def _html_to_text(html: str) -> str:
+    """HTML 본문을 읽기 쉬운 일반 텍스트로 변환합니다.
+    
+    html2text로 마크다운을 만든 뒤 마크다운 서식과 HTML 잔여 태그를 정리합니다.
+    
+    Args:
+        html (str): HTML 본문
+        
+    Returns:
+        str: 변환된 텍스트
+        
+    Raises:
+        ImportError: html2text가 설치되지 않은 경우
+    """
+    text = _get_h2t().handle(html)
+
+    # html2text가 생성한 마크다운을 일반 텍스트로 변환하는 처리
+
+    # 1단계: HTML 태그 정리
+    # HTML 링크 태그를 텍스트로 변환
+    text = re.sub(r'<a\s+[^>]*href=["\'](.*?)["\'][^>]*>(.*?)</a>', r'\2 (\1)', text, flags=re.IGNORECASE|re.DOTALL)
+    # 나머지 HTML 태그 제거
+    text = re.sub(r'<[^>]+>', '', text)
+
+    # 2단계: 마크다운 서식 제거
+    # 표 형식 제거 (|와 -, --------- 등)
+    text = re.sub(r'\|[\s\|]*\n[-]{3,}[\s\n]*', '', text)
+    text = re.sub(r'[-]{3,}', '', text)
+    text = re.sub(r'\|[\s\|]*', '', text)
+
+    # 수평선 제거 (*, -, _)
+    text = re.sub(r'[\*\s]{3,}', '', text)
+    text = re.sub(r'[_\s]{3,}', '', text)
+
+    # 이스케이프 문자 제거
+    text = re.sub(r'\\+\s*\\+', '', text)
+    text = re.sub(r'\\+\s+', ' ', text)
+    text = re.sub(r'\\+([^\s])', r'\1', text)
+
+    # 마크다운 링크 정리 [텍스트](URL) -> 텍스트 (URL)
+    text = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'\1 (\2)', text)
+
+    # 강조 표시 제거
+    text = re.sub(r'\*\*([^*]+)\*\*', r'\1', text)  # 굵은 글씨 (**text**)
+    text = re.sub(r'\*([^*]+)\*', r'\1', text)      # 기울임 글씨 (*text*)
+    text = re.sub(r'__([^_]+)__', r'\1', text)      # 굵은 글씨 (__text__)
+    text = re.sub(r'_([^_]+)_', r'\1', text)        # 기울임 글씨 (_text_)
+    text = re.sub(r'`([^`]+)`', r'\1', text)        # 인라인 코드
+
+    # 3단계: 텍스트 가독성 개선
+    # 연속된 공백 처리
+    text = re.sub(r' {2,}', ' ', text)
+    text = re.sub(r'\n{3,}', '\n\n', text)
+
+    # 문장 구분을 위한 줄바꿈 추가
+    text = re.sub(r'([.!?])\s+([A-Z가-힣])', r'\1\n\2', text)
+
+    # 4단계: 단어 사이 공백 처리 (URL/이메일 제외)
+    # 카멜케이스 처리 (소문자 + 대문자)
+    text = re.sub(r'([a-z])([A-Z])', r'\1 \2', text)
+
+    # 단어가 붙어있는 경우 분리
+    # 'atestemail'과 같이 붙어있는 영어 단어 분리
+    text = re.sub(r'([a-z]{2,})([A-Z][a-z]{2,})', r'\1 \2', text)  
+
+    # 5단계: 특수한 경우 처리
+    # URL이나 이메일에 공백이 들어간 경우 수정
+    # http://... 또는 https://... 형식의 URL 인식
+    text = re.sub(r'(https?:\/\/[^\s]+)\s+([^\s]+)', r'\1\2', text)
+    # 이메일 주소 내 공백 제거
+    text = re.sub(r'([a-zA-Z0-9._%+-]+)\s+@\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r'\1@\2', text)
+
+    # 문장, 구 사이의 공백 처리 개선
+    text = re.sub(r'([.!?])([A-Z가-힣])', r'\1 \2', text)  # 문장 부호 후 공백
+    text = re.sub(r'(\))([A-Z가-힣a-z])', r'\1 \2', text)  # 괄호 후 공백
+
+    # 앞뒤 공백 제거
+    text = text.strip()
+    
+    return text
+
+
+# 변환된 본문을 EmailDto에 반영할 때 사용하는 잠금 (변환 자체는 잠금 밖에서 수행)
+_body_lock = threading.Lock()
+
+
+class _BodyField:
+    """EmailDto 본문 필드 디스크립터
+    
+    dataclass 필드의 기본값 자리에 선언하여 body_content/body_type을 일반 필드(생성자 인자,
+    fields(), asdict() 대상)로 유지하면서, 값을 읽을 때 변환 대기 중인 HTML 본문을 텍스트로 변환합니다.
+    클래스에서 접근하면 AttributeError를 발생시키므로 dataclass는 기본값이 없는 필드로 처리합니다.
+    값은 인스턴스 __dict__의 같은 이름 항목에 저장하므로, pydantic처럼 __dict__를 직접 채워
+    생성한 인스턴스도 그대로 읽을 수 있습니다. (데이터 디스크립터가 __dict__보다 우선)
+    
+    Args:
+        resets_pending (bool, optional): 값을 설정하면 대기 중인 변환을 취소할지 여부. 기본값은 False.
+    """
+    
+    def __init__(self, resets_pending: bool = False):
+        self.resets_pending = resets_pending
+    
+    def __set_name__(self, owner, name):
+        self.name = name
+    
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            raise AttributeError(self.name)
+        if instance._pending_html is not None:
+            instance._convert_pending_html()
+        return instance.__dict__.get(self.name, "")
+    
+    def __set__(self, instance, value):
+        with _body_lock:
+            instance.__dict__[self.name] = value
+            if self.resets_pending:
+                # 직접 설정한 본문은 변환하지 않음
+                instance._pending_html = None
+
+
 @dataclass
 class EmailDto:
     """이메일 데이터 전송 객체 클래스
     
     이메일 정보를 포함하는 데이터 전송 객체(DTO)입니다.
+    from_dict()에서 요청된 HTML → 텍스트 변환은 body_content 또는 body_type에
+    처음 접근할 때 수행됩니다.
+    body_preview_only 옵션으로 조회한 경우 body_content에는 bodyPreview가 들어 있으며,
+    전체 본문은 full_body에 처음 접근할 때 조회합니다.
     
     Attributes:
         id (str): 이메일 ID
@@ -237,14 +497,14 @@ class EmailDto:
         has_attachments (bool): 첨부 파일 여부
         attachments (List[EmailAttachment]): 첨부 파일 목록
         conversation_id (Optional[str]): 대화 ID
-        categories (List[str]): 범주 목록
-        raw_data (Dict[str, Any]): 원본 데이터
+        categories (Tuple[str, ...]): 범주 목록
+        raw_data (Optional[Dict[str, Any]]): 원본 데이터 (keep_raw 옵션 사용 시에만 보관)
     """
     
     id: str
     subject: str
-    body_content: str
-    body_type: str
+    body_content: str = _BodyField(resets_pending=True)
+    body_type: str = _BodyField()
     sender: EmailParticipant
     recipients: List[EmailParticipant] = field(default_factory=list)
     cc_recipients: List[EmailParticipant] = field(default_factory=list)
@@ -256,8 +516,18 @@ class EmailDto:
     has_attachments: bool = False
     attachments: List[EmailAttachment] = field(default_factory=list)
     conversation_id: Optional[str] = None
-    categories: List[str] = field(default_factory=list)
-    raw_data: Dict[str, Any] = field(default_factory=dict)
+    categories: Tuple[str, ...] = ()
+    raw_data: Optional[Dict[str, Any]] = None
+    
+    # 텍스트로 변환할 원본 HTML 본문 (from_dict()에서 설정, 변환 후 None)
+    _pending_html = None
+    
+    # 변환 결과를 가져올 원본 DTO (같은 HTML을 가진 사본들이 한 번만 변환하도록 서비스 캐시가 설정)
+    _body_source = None
+    
+    # 전체 본문 조회 함수 (메시지 ID → EmailDto). body_preview_only 조회 시 게이트웨이가 설정하며,
+    # 타입 주석이 없으므로 dataclass 필드(생성자 인자, asdict 대상)에 포함되지 않습니다.
+    _body_loader = None
     
     @classmethod
     def from_dict(cls, data: Dict[str, Any], processing_options: EmailProcessingOptions = None) -> 'EmailDto':
@@ -273,88 +543,17 @@ class EmailDto:
         if processing_options is None:
             processing_options = EmailProcessingOptions()
             
-        # 본문 처리
-        body = data.get("body", {})
-        body_content = body.get("content", "")
-        body_type = body.get("contentType", "").lower()
-        
-        # HTML을 텍스트로 변환
-        if processing_options.convert_html_to_text and body_type == "html":
-            try:
-                import html2text
-                import re
-                h = html2text.HTML2Text()
-                h.ignore_links = False
-                h.ignore_images = True
-                body_content = h.handle(body_content)
-                
-                # html2text가 생성한 마크다운을 일반 텍스트로 변환하는 처리
-                
-                # 1단계: HTML 태그 정리
-                # HTML 링크 태그를 텍스트로 변환
-                body_content = re.sub(r'<a\s+[^>]*href=["\'](.*?)["\'][^>]*>(.*?)</a>', r'\2 (\1)', body_content, flags=re.IGNORECASE|re.DOTALL)
-                # 나머지 HTML 태그 제거
-                body_content = re.sub(r'<[^>]+>', '', body_content)
-                
-                # 2단계: 마크다운 서식 제거
-                # 표 형식 제거 (|와 -, --------- 등)
-                body_content = re.sub(r'\|[\s\|]*\n[-]{3,}[\s\n]*', '', body_content)
-                body_content = re.sub(r'[-]{3,}', '', body_content)
-                body_content = re.sub(r'\|[\s\|]*', '', body_content)
-                
-                # 수평선 제거 (*, -, _)
-                body_content = re.sub(r'[\*\s]{3,}', '', body_content)
-                body_content = re.sub(r'[_\s]{3,}', '', body_content)
-                
-                # 이스케이프 문자 제거
-                body_content = re.sub(r'\\+\s*\\+', '', body_content)
-                body_content = re.sub(r'\\+\s+', ' ', body_content)
-                body_content = re.sub(r'\\+([^\s])', r'\1', body_content)
-                
-                # 마크다운 링크 정리 [텍스트](URL) -> 텍스트 (URL)
-                body_content = re.sub(r'\[([^\]]+)\]\(([^)]+)\)', r'\1 (\2)', body_content)
-                
-                # 강조 표시 제거
-                body_content = re.sub(r'\*\*([^*]+)\*\*', r'\1', body_content)  # 굵은 글씨 (**text**)
-                body_content = re.sub(r'\*([^*]+)\*', r'\1', body_content)      # 기울임 글씨 (*text*)
-                body_content = re.sub(r'__([^_]+)__', r'\1', body_content)      # 굵은 글씨 (__text__)
-                body_content = re.sub(r'_([^_]+)_', r'\1', body_content)        # 기울임 글씨 (_text_)
-                body_content = re.sub(r'`([^`]+)`', r'\1', body_content)        # 인라인 코드
-                
-                # 3단계: 텍스트 가독성 개선
-                # 연속된 공백 처리
-                body_content = re.sub(r' {2,}', ' ', body_content)
-                body_content = re.sub(r'\n{3,}', '\n\n', body_content)
-                
-                # 문장 구분을 위한 줄바꿈 추가
-                body_content = re.sub(r'([.!?])\s+([A-Z가-힣])', r'\1\n\2', body_content)
-                
-                # 4단계: 단어 사이 공백 처리 (URL/이메일 제외)
-                # 카멜케이스 처리 (소문자 + 대문자)
-                body_content = re.sub(r'([a-z])([A-Z])', r'\1 \2', body_content)
-                
-                # 단어가 붙어있는 경우 분리
-                # 'atestemail'과 같이 붙어있는 영어 단어 분리
-                body_content = re.sub(r'([a-z]{2,})([A-Z][a-z]{2,})', r'\1 \2', body_content)  
-                
-                # 5단계: 특수한 경우 처리
-                # URL이나 이메일에 공백이 들어간 경우 수정
-                # http://... 또는 https://... 형식의 URL 인식
-                body_content = re.sub(r'(https?:\/\/[^\s]+)\s+([^\s]+)', r'\1\2', body_content)
-                # 이메일 주소 내 공백 제거
-                body_content = re.sub(r'([a-zA-Z0-9._%+-]+)\s+@\s+([a-zA-Z0-9.-]+\.[a-zA-Z]{2,})', r'\1@\2', body_content)
-                
-                # 문장, 구 사이의 공백 처리 개선
-                body_content = re.sub(r'([.!?])([A-Z가-힣])', r'\1 \2', body_content)  # 문장 부호 후 공백
-                body_content = re.sub(r'(\))([A-Z가-힣a-z])', r'\1 \2', body_content)  # 괄호 후 공백
-                
-                # 앞뒤 공백 제거
-                body_content = body_content.strip()
-                
-                body_type = "text"
-            except ImportError:
-                # html2text가 설치되지 않은 경우
-                pass
+        # 본문 처리 (HTML → 텍스트 변환은 본문에 처음 접근할 때 수행)
+        if processing_options.body_preview_only and "body" not in data:
+            # 미리보기만 조회한 경우 bodyPreview(일반 텍스트)를 본문으로 사용
+            body_content = data.get("bodyPreview", "")
+            body_type = _TEXT
+        else:
+            body = data.get("body", {})
+            body_content = body.get("content", "")
+            content_type = body.get("contentType", "")
+            # Graph API는 대부분 소문자로 반환하므로 .lower()는 그 외의 경우에만 호출
+            body_type = _HTML if content_type == "html" or content_type.lower() == "html" else _TEXT
         
         # 발신자 처리
         sender = data.get("from", {}).get("emailAddress", {})
@@ -374,27 +573,18 @@ class EmailDto:
             sent_date = datetime.fromisoformat(data["sentDateTime"].replace("Z", "+00:00"))
         
         # 수신자 처리
-        recipients = []
-        for recipient_data in data.get("toRecipients", []):
-            recipients.append(EmailParticipant.from_dict(recipient_data, "to"))
-            
-        cc_recipients = []
-        for cc_data in data.get("ccRecipients", []):
-            cc_recipients.append(EmailParticipant.from_dict(cc_data, "cc"))
-            
-        bcc_recipients = []
-        for bcc_data in data.get("bccRecipients", []):
-            bcc_recipients.append(EmailParticipant.from_dict(bcc_data, "bcc"))
+        recipients = [EmailParticipant.from_dict(r, "to") for r in data.get("toRecipients") or ()]
+        cc_recipients = [EmailParticipant.from_dict(r, "cc") for r in data.get("ccRecipients") or ()]
+        bcc_recipients = [EmailParticipant.from_dict(r, "bcc") for r in data.get("bccRecipients") or ()]
         
         # 첨부 파일 처리
         has_attachments = data.get("hasAttachments", False)
         attachments = []
         
         if processing_options.include_attachments and has_attachments:
-            for attachment_data in data.get("attachments", []):
-                attachments.append(EmailAttachment.from_dict(attachment_data))
+            attachments = [EmailAttachment.from_dict(a) for a in data.get("attachments") or ()]
         
-        return cls(
+        email_dto = cls(
             id=data.get("id", ""),
             subject=data.get("subject", "(제목 없음)"),
             body_content=body_content,
@@ -410,13 +600,87 @@ class EmailDto:
             has_attachments=has_attachments,
             attachments=attachments,
             conversation_id=data.get("conversationId"),
-            categories=data.get("categories", []),
-            raw_data=data
+            categories=tuple(data.get("categories") or ()),
+            raw_data=data if processing_options.keep_raw else None
         )
+        if processing_options.convert_html_to_text and body_type is _HTML:
+            email_dto._pending_html = body_content
+        return email_dto
     
-    def to_dict(self) -> Dict[str, Any]:
-        """EmailDto 객체를 딕셔너리로 변환합니다.
-        (Graph API 요청 본문에 사용할 수 있는 형식)
+    @classmethod
+    def from_list(
+        cls,
+        items: List[Dict[str, Any]],
+        processing_options: EmailProcessingOptions = None
+    ) -> List['EmailDto']:
+        """딕셔너리 목록에서 EmailDto 객체 목록을 한 번에 생성합니다.
+        
+        HTML → 텍스트 변환은 from_dict()와 같이 각 본문에 처음 접근할 때 수행하므로
+        읽지 않는 본문은 변환하지 않습니다.
+        
+        Args:
+            items (List[Dict[str, Any]]): 이메일 정보가 포함된 딕셔너리 목록
+            processing_options (EmailProcessingOptions, optional): 처리 옵션
+            
+        Returns:
+            List[EmailDto]: 생성된 EmailDto 객체 목록
+        """
+        if processing_options is None:
+            processing_options = EmailProcessingOptions()
+            
+        return [cls.from_dict(item, processing_options) for item in items]
+    
+    def _convert_pending_html(self) -> None:
+        """변환 대기 중인 HTML 본문을 텍스트로 변환합니다.
+        
+        변환이 끝나 결과를 반영한 뒤에 대기 표시를 지우므로, 캐시로 공유된 DTO를 다른 스레드가
+        동시에 읽어도 원본 HTML이나 반쯤 반영된 값을 보지 않습니다. 동시에 변환한 경우에는
+        먼저 끝난 결과 하나만 반영됩니다. 원본 DTO(_body_source)가 있으면 원본을 변환하고
+        그 결과를 가져오므로, 원본의 사본들은 같은 본문을 한 번만 변환합니다.
+        """
+        html = self._pending_html
+        if html is None:
+            return
+        source = self._body_source
+        if source is not None:
+            source._convert_pending_html()
+            text, body_type = source.__dict__["body_content"], source.__dict__["body_type"]
+        else:
+            try:
+                text, body_type = _html_to_text(html), _TEXT
+            except ImportError:
+                # html2text가 설치되지 않은 경우 HTML 그대로 유지
+                text, body_type = html, _HTML
+        with _body_lock:
+            if self._pending_html is html:
+                self.__dict__["body_content"] = text
+                self.__dict__["body_type"] = body_type
+                self._pending_html = None
+                self._body_source = None
+    
+    @property
+    def full_body(self) -> str:
+        """전체 본문 내용을 반환합니다.
+        
+        body_preview_only 옵션으로 조회한 경우 처음 접근할 때 메시지 본문을 조회하여
+        body_content와 body_type을 전체 본문으로 교체하고, 이후에는 그 값을 그대로 반환합니다.
+        
+        Returns:
+            str: 전체 본문 내용
+            
+        Raises:
+            GraphApiError: 본문 조회 실패 시
+        """
+        loader = self._body_loader
+        if loader is not None:
+            loaded = loader(self.id)
+            self._body_loader = None
+            self.body_content = loaded.body_content
+            self.body_type = loaded.body_type
+        return self.body_content
+    
+    def to_graph_payload(self) -> Dict[str, Any]:
+        """EmailDto 객체를 Graph API 요청 본문 형식의 딕셔너리로 변환합니다.
         
         Returns:
             Dict[str, Any]: 변환된 딕셔너리
@@ -438,3 +702,21 @@ class EmailDto:
             result["bccRecipients"] = [recipient.to_dict() for recipient in self.bcc_recipients]
             
         return result
+
+
+@dataclass
+class DeltaRefreshResult:
+    """델타 새로고침 결과 클래스
+    
+    EmailService.refresh()의 결과로, 변경된 이메일과 함께 결과의 성격을 알려줍니다.
+    
+    Attributes:
+        emails (List[EmailDto]): 변경된 이메일 목록. reset이 True이면 기본 범위의 전체 목록.
+        reset (bool): 델타 링크가 만료(410 Gone)되어 변경분 대신 전체 목록을 반환했는지 여부.
+            True이면 클라이언트는 기존 목록을 emails로 교체해야 합니다.
+        has_more (bool): 페이지 한도로 중단되어 다음 새로고침에서 이어서 받을 변경분이 남았는지 여부
+    """
+    
+    emails: List[EmailDto] = field(default_factory=list)
+    reset: bool = False
+    has_more: bool = False
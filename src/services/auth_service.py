@@ -3,7 +3,9 @@
 이 모듈은 인증 관련 비즈니스 로직을 제공합니다.
 """
 
-from typing import Optional, Dict, Any
+import time
+from functools import lru_cache
+from typing import Optional, Dict, Any, Tuple
 from datetime import datetime, timedelta
 
 from src.utils.logging_config import LoggerFactory
@@ -15,6 +17,35 @@ from src.schemas.auth import TokenCredential, UserInfo, AuthStatus, AuthResult
 # 로거 설정
 logger = LoggerFactory.get_logger(__name__)
 
+# 재인증 없이 기존 토큰을 사용할 수 있는 최소 남은 시간
+_TOKEN_REFRESH_THRESHOLD = timedelta(minutes=30)
+
+# 인증 상태 캐시 유지 시간(초)
+_STATUS_CACHE_TTL = 5.0
+
+
+def _fresh_token_result(status: AuthStatus) -> Optional[AuthResult]:
+    """기존 토큰이 충분히 유효하면 재인증 없이 사용할 인증 결과를 반환합니다.
+    
+    Args:
+        status (AuthStatus): 현재 인증 상태
+        
+    Returns:
+        Optional[AuthResult]: 토큰이 유효하면 성공 결과, 재인증이 필요하면 None
+    """
+    logger.debug("이미 인증된 상태, 토큰 유효성 확인")
+    
+    # 토큰이 30분 이상 남았으면 재인증 필요 없음
+    if status.token_expires_at and status.token_expires_at - datetime.now() > _TOKEN_REFRESH_THRESHOLD:
+        logger.info("유효한 토큰 존재, 재인증 불필요")
+        return AuthResult(
+            success=True,
+            status=status
+        )
+        
+    logger.debug("토큰 만료 예정, 재인증 필요")
+    return None
+
 
 class AuthService:
     """인증 서비스 클래스
@@ -25,6 +56,7 @@ class AuthService:
     def __init__(self):
         """초기화 메소드"""
         self.auth_manager = AuthTokenManager()
+        self._status_cache: Optional[Tuple[float, AuthStatus]] = None
         logger.debug("AuthService 초기화 완료")
     
     def authenticate_interactive(self) -> AuthResult:
@@ -39,23 +71,15 @@ class AuthService:
         
         # 이미 인증된 경우 토큰이 유효한지 확인
         if self.auth_manager.is_authenticated():
-            logger.debug("이미 인증된 상태, 토큰 유효성 확인")
-            status = self.auth_manager.get_auth_status()
-            
-            # 토큰이 30분 이상 남았으면 재인증 필요 없음
-            if status.token_expires_at and status.token_expires_at > (datetime.now() + timedelta(minutes=30)):
-                logger.info("유효한 토큰 존재, 재인증 불필요")
-                return AuthResult(
-                    success=True,
-                    status=status
-                )
-                
-            logger.debug("토큰 만료 예정, 재인증 필요")
+            cached_result = _fresh_token_result(self.get_auth_status())
+            if cached_result:
+                return cached_result
         
         # 인증 코드 흐름으로 인증
         auth_result = self.auth_manager.authenticate_code_flow()
         
         if auth_result.success:
+            self._status_cache = None
             logger.info("대화형 인증 성공")
         else:
             logger.error(f"대화형 인증 실패: {auth_result.error_message}")
@@ -74,23 +98,15 @@ class AuthService:
         
         # 이미 인증된 경우 토큰이 유효한지 확인
         if self.auth_manager.is_authenticated():
-            logger.debug("이미 인증된 상태, 토큰 유효성 확인")
-            status = self.auth_manager.get_auth_status()
-            
-            # 토큰이 30분 이상 남았으면 재인증 필요 없음
-            if status.token_expires_at and status.token_expires_at > (datetime.now() + timedelta(minutes=30)):
-                logger.info("유효한 토큰 존재, 재인증 불필요")
-                return AuthResult(
-                    success=True,
-                    status=status
-                )
-                
-            logger.debug("토큰 만료 예정, 재인증 필요")
+            cached_result = _fresh_token_result(self.get_auth_status())
+            if cached_result:
+                return cached_result
         
         # 디바이스 코드 흐름으로 인증
         auth_result = self.auth_manager.authenticate_device_flow()
         
         if auth_result.success:
+            self._status_cache = None
             logger.info("디바이스 코드 인증 성공")
         else:
             logger.error(f"디바이스 코드 인증 실패: {auth_result.error_message}")
@@ -109,23 +125,15 @@ class AuthService:
         
         # 이미 인증된 경우 토큰이 유효한지 확인
         if self.auth_manager.is_authenticated():
-            logger.debug("이미 인증된 상태, 토큰 유효성 확인")
-            status = self.auth_manager.get_auth_status()
-            
-            # 토큰이 30분 이상 남았으면 재인증 필요 없음
-            if status.token_expires_at and status.token_expires_at > (datetime.now() + timedelta(minutes=30)):
-                logger.info("유효한 토큰 존재, 재인증 불필요")
-                return AuthResult(
-                    success=True,
-                    status=status
-                )
-                
-            logger.debug("토큰 만료 예정, 재인증 필요")
+            cached_result = _fresh_token_result(self.get_auth_status())
+            if cached_result:
+                return cached_result
         
         # 클라이언트 자격 증명 흐름으로 인증
         auth_result = self.auth_manager.authenticate_client_credentials()
         
         if auth_result.success:
+            self._status_cache = None
             logger.info("클라이언트 자격 증명 인증 성공")
         else:
             logger.error(f"클라이언트 자격 증명 인증 실패: {auth_result.error_message}")
@@ -143,10 +151,19 @@ class AuthService:
     def get_auth_status(self) -> AuthStatus:
         """현재 인증 상태를 조회합니다.
         
+        짧은 시간 안에 반복 호출되는 경우 토큰 캐시와 사용자 정보를 다시 조회하지 않도록
+        조회 결과를 _STATUS_CACHE_TTL 초 동안 재사용합니다.
+        
         Returns:
             AuthStatus: 인증 상태 정보
         """
-        return self.auth_manager.get_auth_status()
+        status = self._get_cached_status()
+        if status is not None:
+            return status
+            
+        status = self.auth_manager.get_auth_status()
+        self._status_cache = (time.monotonic(), status)
+        return status
     
     def get_user_info(self) -> Optional[UserInfo]:
         """현재 인증된 사용자 정보를 조회합니다.
@@ -164,6 +181,7 @@ class AuthService:
         """
         logger.info("로그아웃 시작")
         result = self.auth_manager.logout()
+        self._status_cache = None
         
         if result:
             logger.info("로그아웃 성공")
@@ -175,11 +193,37 @@ class AuthService:
     def is_authenticated(self) -> bool:
         """현재 인증 상태를 확인합니다.
         
+        최근에 조회한 인증 상태가 캐시되어 있고 만료되지 않은 토큰으로 인증된 상태라면
+        토큰 관리자를 다시 조회하지 않습니다.
+        
         Returns:
             bool: 인증되었으면 True, 아니면 False
         """
+        status = self._get_cached_status()
+        if status is not None and status.is_authenticated:
+            return True
+            
         return self.auth_manager.is_authenticated()
     
+    def _get_cached_status(self) -> Optional[AuthStatus]:
+        """유효 시간 안에 캐시된 인증 상태를 반환합니다.
+        
+        인증된 상태라도 토큰이 이미 만료되었거나 만료 시각을 알 수 없으면 캐시를 사용하지 않습니다.
+        
+        Returns:
+            Optional[AuthStatus]: 캐시된 인증 상태, 사용할 수 없으면 None
+        """
+        cached = self._status_cache
+        if cached is None or time.monotonic() - cached[0] >= _STATUS_CACHE_TTL:
+            return None
+            
+        status = cached[1]
+        if status.is_authenticated and (
+            status.token_expires_at is None or status.token_expires_at <= datetime.now()
+        ):
+            return None
+        return status
+    
     def print_auth_status(self) -> None:
         """현재 인증 상태를 출력합니다."""
         status = self.get_auth_status()
@@ -200,3 +244,16 @@ class AuthService:
             print(f"사용자 이메일: {status.user_info.mail or status.user_info.user_principal_name}")
             
         print(f"권한 범위: {', '.join(status.scopes)}")
+
+
+@lru_cache(maxsize=1)
+def get_default_auth_service() -> AuthService:
+    """프로세스 전체에서 공유하는 기본 AuthService를 반환합니다.
+    
+    API 라우터가 같은 인스턴스를 사용하므로, 한 라우터에서 로그아웃하거나 다시 인증하면
+    다른 라우터의 인증 상태 캐시도 함께 무효화됩니다.
+    
+    Returns:
+        AuthService: 공유 인증 서비스 인스턴스
+    """
+    return AuthService()
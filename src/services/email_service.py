@@ -3,19 +3,222 @@
 이 모듈은 이메일 관련 비즈니스 로직을 제공합니다.
 """
 
-from typing import List, Optional, Dict, Any, Tuple, Union
+import copy
+import functools
+import inspect
+import logging
+import sys
+import threading
+import time
+from dataclasses import replace
+from functools import lru_cache
+from typing import Callable, FrozenSet, Iterator, List, Optional, Dict, Any, Tuple, TypeVar, Union
 from datetime import datetime, timedelta
 
 from src.utils.logging_config import LoggerFactory
 from src.utils.exceptions import EmailProcessingError, GraphApiError
 from src.infra.config import Config
-from src.infra.graph_gateway import GraphApiGateway
-from src.schemas.email import EmailDto, EmailFilter, EmailProcessingOptions
+from src.infra.graph_gateway import get_default_gateway
+from src.schemas.email import DeltaRefreshResult, EmailDto, EmailFilter, EmailProcessingOptions, EmailParticipant
 
 
 # 로거 설정
 logger = LoggerFactory.get_logger(__name__)
 
+# Config.PARALLEL_FETCH가 켜져 있을 때 이 개수 이상을 조회하면 $skip 범위별 병렬 조회 사용
+_PARALLEL_FETCH_MIN_LIMIT = 200
+
+# 목록/검색 결과 캐시의 유효 시간(초)과 최대 항목 수
+_LIST_CACHE_TTL = 30.0
+_LIST_CACHE_MAXSIZE = 64
+
+# 폴더 및 참여자 유형 상수 (모든 호출에서 같은 문자열 객체 사용)
+_FOLDER_INBOX = sys.intern("inbox")
+_FOLDER_SENT = sys.intern("sentItems")
+_TYPE_FROM = sys.intern("from")
+_TYPE_TO = sys.intern("to")
+_TYPE_CC = sys.intern("cc")
+_TYPE_BCC = sys.intern("bcc")
+
+# 로그에 표시할 폴더 이름
+_FOLDER_NAMES = {_FOLDER_INBOX: "수신함", _FOLDER_SENT: "송신함"}
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+@lru_cache(maxsize=1)
+def _now_second_bucket(bucket: int) -> datetime:
+    """초 단위 현재 시각을 반환합니다.
+    
+    같은 초 안의 호출은 캐시된 datetime 객체를 재사용합니다.
+    
+    Args:
+        bucket (int): 현재 유닉스 시각(초), int(time.time())
+        
+    Returns:
+        datetime: 로컬 시간 기준 현재 시각 (초 단위)
+    """
+    return datetime.fromtimestamp(bucket)
+
+
+@lru_cache(maxsize=64)
+def _processing_options(
+    include_body: bool,
+    filter_senders: bool,
+    convert_html_to_text: bool = True,
+    body_preview_only: bool = False
+) -> EmailProcessingOptions:
+    """조회용 처리 옵션을 반환합니다.
+    
+    EmailProcessingOptions는 불변 객체이므로 같은 인자에는 같은 인스턴스를 재사용합니다.
+    
+    Args:
+        include_body (bool): 본문 포함 여부
+        filter_senders (bool): 발신자 필터링 적용 여부
+        convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+        body_preview_only (bool, optional): 본문 대신 bodyPreview만 조회할지 여부. 기본값은 False.
+        
+    Returns:
+        EmailProcessingOptions: 처리 옵션
+    """
+    return EmailProcessingOptions(
+        include_body=include_body,
+        apply_filters=filter_senders,
+        convert_html_to_text=convert_html_to_text,
+        body_preview_only=body_preview_only
+    )
+
+
+def _copy_emails(emails: List[EmailDto]) -> List[EmailDto]:
+    """이메일 DTO 리스트의 사본을 반환합니다.
+    
+    목록 캐시의 DTO를 여러 호출자가 공유하지 않도록 DTO와 리스트 필드를 복사합니다.
+    (EmailParticipant는 불변 객체이므로 리스트만 새로 만들고, 첨부 파일은 객체도 복사)
+    이미 변환된 본문은 그대로 복사되고, 변환 대기 중인 본문은 원본 DTO를 통해 변환하므로
+    같은 캐시 항목의 사본들은 HTML 본문을 한 번만 변환합니다.
+    
+    Args:
+        emails (List[EmailDto]): 복사할 이메일 DTO 리스트
+        
+    Returns:
+        List[EmailDto]: 이메일 DTO 사본 리스트
+    """
+    copies = []
+    for email in emails:
+        dup = copy.copy(email)
+        dup.recipients = list(email.recipients)
+        dup.cc_recipients = list(email.cc_recipients)
+        dup.bcc_recipients = list(email.bcc_recipients)
+        dup.attachments = [copy.copy(attachment) for attachment in email.attachments]
+        if email._pending_html is not None:
+            dup._body_source = email
+        copies.append(dup)
+    return copies
+
+
+def _minute_bucket(days: Optional[int]) -> Optional[int]:
+    """days 기준 조회의 캐시 키에 사용할 분 단위 시각을 반환합니다.
+    
+    "최근 N일" 조회는 현재 시각에 따라 조회 범위가 달라지므로, 분이 바뀌면
+    캐시 키도 달라지도록 합니다.
+    
+    Args:
+        days (Optional[int]): 조회할 일수
+        
+    Returns:
+        Optional[int]: 현재 유닉스 시각(분), days가 None이면 None
+    """
+    if days is None:
+        return None
+    return int(time.time()) // 60
+
+
+def _split_budget(total_limit: int) -> Tuple[int, int]:
+    """전체 할당량을 수신함과 송신함의 조회 개수로 나눕니다.
+    
+    수신함에 절반(최소 1개)을, 송신함에 나머지를 배정합니다.
+    
+    Args:
+        total_limit (int): 두 폴더를 합친 최대 결과 수 (1 이상)
+        
+    Returns:
+        Tuple[int, int]: 수신함, 송신함 조회 개수
+    """
+    inbox_limit = max(1, total_limit // 2)
+    return inbox_limit, total_limit - inbox_limit
+
+
+def _display_name(email: str) -> str:
+    """이메일 주소에서 표시 이름(@ 앞부분)을 추출합니다.
+    
+    Args:
+        email (str): 이메일 주소
+        
+    Returns:
+        str: @ 앞부분, @가 없으면 주소 전체
+    """
+    head, sep, _ = email.partition('@')
+    return head if sep else email
+
+
+def _query_label(folder: str, include_body: bool) -> str:
+    """로그에 표시할 폴더 조회 설명을 반환합니다.
+    
+    Args:
+        folder (str): 폴더
+        include_body (bool): 본문 포함 여부
+        
+    Returns:
+        str: 조회 설명 (예: '수신함 이메일 조회 (본문 포함)')
+    """
+    folder_name = _FOLDER_NAMES.get(folder, folder)
+    if include_body:
+        return f"{folder_name} 이메일 조회 (본문 포함)"
+    return f"{folder_name} 이메일 목록 조회"
+
+
+def _graph_call(label: str) -> Callable[[F], F]:
+    """Graph API를 호출하는 서비스 메서드의 오류 처리를 통일하는 데코레이터입니다.
+    
+    GraphApiError와 EmailProcessingError는 그대로 전파하고, 그 외 오류는 로깅 후
+    EmailProcessingError로 변환합니다. 요청 제한(429) 재시도는 게이트웨이에서 처리합니다.
+    
+    Args:
+        label (str): 로그와 오류 메시지에 사용할 작업 이름 (예: "이메일 조회")
+        
+    Returns:
+        Callable[[F], F]: 데코레이터
+    """
+    def wrap_error(e: Exception) -> EmailProcessingError:
+        logger.exception("%s 중 오류 발생", label)
+        return EmailProcessingError(f"{label} 중 오류 발생: {str(e)}")
+        
+    def decorator(func: F) -> F:
+        if inspect.isgeneratorfunction(func):
+            @functools.wraps(func)
+            def gen_wrapper(*args, **kwargs):
+                try:
+                    yield from func(*args, **kwargs)
+                except (GraphApiError, EmailProcessingError):
+                    raise
+                except Exception as e:
+                    raise wrap_error(e)
+                    
+            return gen_wrapper
+            
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            try:
+                return func(*args, **kwargs)
+            except (GraphApiError, EmailProcessingError):
+                raise
+            except Exception as e:
+                raise wrap_error(e)
+                
+        return wrapper
+        
+    return decorator
+
 
 class EmailService:
     """이메일 서비스 클래스
@@ -25,7 +228,12 @@ class EmailService:
     
     def __init__(self):
         """초기화 메소드"""
-        self.graph_gateway = GraphApiGateway()
+        self.graph_gateway = get_default_gateway()
+        
+        # 목록/검색 결과 캐시: 키 -> (저장 시각, 결과)
+        self._list_cache: Dict[Tuple[Any, ...], Tuple[float, Any]] = {}
+        self._list_cache_lock = threading.Lock()
+        
         logger.debug("EmailService 초기화 완료")
     
     def get_inbox_emails(
@@ -48,40 +256,12 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정 (본문 제외)
-            processing_options = EmailProcessingOptions(
-                include_body=False,
-                apply_filters=filter_senders
-            )
-                
-            # 필터 옵션 설정
-            filter_options = EmailFilter(
-                folder="inbox",
-                limit=limit or Config.DEFAULT_LIMIT,
-                exclude_senders=Config.get_filter_senders() if filter_senders else []
-            )
-            
-            # 날짜 필터 설정
-            if days is not None:
-                filter_options.start_date = datetime.now() - timedelta(days=days)
-                
-            logger.debug(f"수신함 이메일 목록 조회: {days}일, 최대 {filter_options.limit}개")
-            
-            # 메시지 조회
-            emails = self.graph_gateway.get_messages(filter_options, processing_options)
-            
-            logger.info(f"수신함 이메일 목록 조회 완료: {len(emails)}개")
-            return emails
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
-            
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 조회 중 오류 발생")
-            raise EmailProcessingError(f"이메일 조회 중 오류 발생: {str(e)}")
+        return self._get_folder_emails(
+            _FOLDER_INBOX,
+            days=days,
+            limit=limit or Config.DEFAULT_LIMIT,
+            filter_senders=filter_senders
+        )
     
     def get_sent_emails(
         self, 
@@ -103,53 +283,29 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정 (본문 제외)
-            processing_options = EmailProcessingOptions(
-                include_body=False,
-                apply_filters=filter_senders
-            )
-                
-            # 필터 옵션 설정
-            filter_options = EmailFilter(
-                folder="sentItems",
-                limit=limit or Config.DEFAULT_LIMIT,
-                exclude_senders=Config.get_filter_senders() if filter_senders else []
-            )
-            
-            # 날짜 필터 설정
-            if days is not None:
-                filter_options.start_date = datetime.now() - timedelta(days=days)
-                
-            logger.debug(f"송신함 이메일 목록 조회: {days}일, 최대 {filter_options.limit}개")
-            
-            # 메시지 조회
-            emails = self.graph_gateway.get_messages(filter_options, processing_options)
-            
-            logger.info(f"송신함 이메일 목록 조회 완료: {len(emails)}개")
-            return emails
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
-            
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 조회 중 오류 발생")
-            raise EmailProcessingError(f"이메일 조회 중 오류 발생: {str(e)}")
+        return self._get_folder_emails(
+            _FOLDER_SENT,
+            days=days,
+            limit=limit or Config.DEFAULT_LIMIT,
+            filter_senders=filter_senders
+        )
     
     def get_all_emails(
         self, 
         days: Optional[int] = None,
         limit: Optional[int] = None,
-        filter_senders: bool = True
+        filter_senders: bool = True,
+        total_limit: Optional[int] = None
     ) -> Dict[str, List[EmailDto]]:
         """모든 이메일(수신함, 송신함) 목록을 조회합니다. (본문 제외)
         
         Args:
             days (Optional[int], optional): 조회할 일수. 기본값은 None.
-            limit (Optional[int], optional): 최대 결과 수. 기본값은 None.
+            limit (Optional[int], optional): 폴더별 최대 결과 수. 기본값은 None.
             filter_senders (bool, optional): 발신자 필터링 적용 여부. 기본값은 True.
+            total_limit (Optional[int], optional): 두 폴더를 합친 최대 결과 수. 지정하면 limit 대신
+                사용하며, 폴더별로 절반씩 배정하되 한 폴더가 모자라면 남은 수를 다른 폴더에 배정합니다.
+                기본값은 None.
             
         Returns:
             Dict[str, List[EmailDto]]: 폴더별 이메일 DTO 리스트
@@ -159,23 +315,12 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 각 폴더별로 이메일 조회
-            inbox_emails = self.get_inbox_emails(days, limit, filter_senders)
-            sent_emails = self.get_sent_emails(days, limit, filter_senders)
-            
-            # 결과 합치기
-            return {
-                'inbox': inbox_emails,
-                'sentItems': sent_emails
-            }
-            
-        except Exception as e:
-            # 오류 처리
-            logger.exception("모든 이메일 조회 중 오류 발생")
-            if isinstance(e, (EmailProcessingError, GraphApiError)):
-                raise
-            raise EmailProcessingError(f"모든 이메일 조회 중 오류 발생: {str(e)}")
+        return self._get_all_folder_emails(
+            days=days,
+            limit=limit or Config.DEFAULT_LIMIT,
+            filter_senders=filter_senders,
+            total_limit=total_limit
+        )
     
     def get_inbox_emails_with_body(
         self, 
@@ -184,7 +329,8 @@ class EmailService:
         days: Optional[int] = None,
         limit: int = 1000,
         filter_senders: bool = True,
-        convert_html_to_text: bool = True
+        convert_html_to_text: bool = True,
+        body_preview_only: bool = False
     ) -> List[EmailDto]:
         """수신함 이메일을 본문과 함께 조회합니다.
         
@@ -197,6 +343,9 @@ class EmailService:
             limit (int, optional): 최대 결과 수. 기본값은 1000.
             filter_senders (bool, optional): 발신자 필터링 적용 여부. 기본값은 True.
             convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+            body_preview_only (bool, optional): 본문 대신 bodyPreview만 조회할지 여부.
+                True이면 body_content에 미리보기가 들어 있고, 전체 본문은 EmailDto.full_body에
+                처음 접근할 때 메시지별로 조회합니다. 기본값은 False.
             
         Returns:
             List[EmailDto]: 이메일 DTO 리스트 (본문 포함)
@@ -205,47 +354,62 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정 (본문 포함)
-            processing_options = EmailProcessingOptions(
-                include_body=True,
-                apply_filters=filter_senders,
-                convert_html_to_text=convert_html_to_text
-            )
-                
-            # 필터 옵션 설정
-            filter_options = EmailFilter(
-                folder="inbox",
-                limit=limit,
-                exclude_senders=Config.get_filter_senders() if filter_senders else []
-            )
-            
-            # 날짜 필터 설정 (우선순위: 직접 지정된 날짜 > days 파라미터)
-            if start_date is not None:
-                filter_options.start_date = start_date
-            elif days is not None:
-                filter_options.start_date = datetime.now() - timedelta(days=days)
-                
-            if end_date is not None:
-                filter_options.end_date = end_date
-                
-            logger.debug(f"수신함 이메일 조회 (본문 포함): {days}일, 최대 {filter_options.limit}개")
-            
-            # 메시지 조회
-            emails = self.graph_gateway.get_messages(filter_options, processing_options)
-            
-            logger.info(f"수신함 이메일 조회 완료 (본문 포함): {len(emails)}개")
-            return emails
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
+        return self._get_folder_emails(
+            _FOLDER_INBOX,
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            include_body=True,
+            convert_html_to_text=convert_html_to_text,
+            body_preview_only=body_preview_only
+        )
+    
+    def iter_inbox_emails_with_body(
+        self, 
+        start_date: Optional[Union[datetime, str]] = None,
+        end_date: Optional[Union[datetime, str]] = None,
+        days: Optional[int] = None,
+        limit: int = 1000,
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True,
+        body_preview_only: bool = False
+    ) -> Iterator[EmailDto]:
+        """수신함 이메일을 본문과 함께 페이지 단위로 조회하며 하나씩 반환합니다.
+        
+        Args:
+            start_date (Optional[Union[datetime, str]], optional): 조회 시작 날짜.
+                datetime 객체 또는 ISO 8601 형식 문자열(예: '2025-03-01T00:00:00Z'). 기본값은 None.
+            end_date (Optional[Union[datetime, str]], optional): 조회 종료 날짜.
+                datetime 객체 또는 ISO 8601 형식 문자열(예: '2025-03-11T23:59:59Z'). 기본값은 None.
+            days (Optional[int], optional): 조회할 일수 (start_date가 None일 경우에만 사용). 기본값은 None.
+            limit (int, optional): 최대 결과 수. 기본값은 1000.
+            filter_senders (bool, optional): 발신자 필터링 적용 여부. 기본값은 True.
+            convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+            body_preview_only (bool, optional): 본문 대신 bodyPreview만 조회할지 여부.
+                True이면 body_content에 미리보기가 들어 있고, 전체 본문은 EmailDto.full_body에
+                처음 접근할 때 메시지별로 조회합니다. 기본값은 False.
             
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 조회 중 오류 발생")
-            raise EmailProcessingError(f"이메일 조회 중 오류 발생: {str(e)}")
+        Yields:
+            EmailDto: 이메일 DTO (본문 포함)
             
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        return self._iter_folder_emails(
+            _FOLDER_INBOX,
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            include_body=True,
+            convert_html_to_text=convert_html_to_text,
+            body_preview_only=body_preview_only
+        )
+    
     def get_sent_emails_with_body(
         self, 
         start_date: Optional[Union[datetime, str]] = None,
@@ -274,47 +438,56 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정 (본문 포함)
-            processing_options = EmailProcessingOptions(
-                include_body=True,
-                apply_filters=filter_senders,
-                convert_html_to_text=convert_html_to_text
-            )
-                
-            # 필터 옵션 설정
-            filter_options = EmailFilter(
-                folder="sentItems",
-                limit=limit,
-                exclude_senders=Config.get_filter_senders() if filter_senders else []
-            )
-            
-            # 날짜 필터 설정 (우선순위: 직접 지정된 날짜 > days 파라미터)
-            if start_date is not None:
-                filter_options.start_date = start_date
-            elif days is not None:
-                filter_options.start_date = datetime.now() - timedelta(days=days)
-                
-            if end_date is not None:
-                filter_options.end_date = end_date
-                
-            logger.debug(f"송신함 이메일 조회 (본문 포함): {days}일, 최대 {filter_options.limit}개")
-            
-            # 메시지 조회
-            emails = self.graph_gateway.get_messages(filter_options, processing_options)
-            
-            logger.info(f"송신함 이메일 조회 완료 (본문 포함): {len(emails)}개")
-            return emails
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
+        return self._get_folder_emails(
+            _FOLDER_SENT,
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            include_body=True,
+            convert_html_to_text=convert_html_to_text
+        )
+    
+    def iter_sent_emails_with_body(
+        self, 
+        start_date: Optional[Union[datetime, str]] = None,
+        end_date: Optional[Union[datetime, str]] = None,
+        days: Optional[int] = None,
+        limit: int = 1000,
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True
+    ) -> Iterator[EmailDto]:
+        """송신함 이메일을 본문과 함께 페이지 단위로 조회하며 하나씩 반환합니다.
+        
+        Args:
+            start_date (Optional[Union[datetime, str]], optional): 조회 시작 날짜.
+                datetime 객체 또는 ISO 8601 형식 문자열(예: '2025-03-01T00:00:00Z'). 기본값은 None.
+            end_date (Optional[Union[datetime, str]], optional): 조회 종료 날짜.
+                datetime 객체 또는 ISO 8601 형식 문자열(예: '2025-03-11T23:59:59Z'). 기본값은 None.
+            days (Optional[int], optional): 조회할 일수 (start_date가 None일 경우에만 사용). 기본값은 None.
+            limit (int, optional): 최대 결과 수. 기본값은 1000.
+            filter_senders (bool, optional): 발신자 필터링 적용 여부. 기본값은 True.
+            convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
             
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 조회 중 오류 발생")
-            raise EmailProcessingError(f"이메일 조회 중 오류 발생: {str(e)}")
+        Yields:
+            EmailDto: 이메일 DTO (본문 포함)
             
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        return self._iter_folder_emails(
+            _FOLDER_SENT,
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            include_body=True,
+            convert_html_to_text=convert_html_to_text
+        )
+    
     def get_all_emails_with_body(
         self, 
         start_date: Optional[Union[datetime, str]] = None,
@@ -322,7 +495,8 @@ class EmailService:
         days: Optional[int] = None,
         limit: int = 1000,
         filter_senders: bool = True,
-        convert_html_to_text: bool = True
+        convert_html_to_text: bool = True,
+        total_limit: Optional[int] = None
     ) -> Dict[str, List[EmailDto]]:
         """모든 이메일(수신함, 송신함)을 본문과 함께 조회합니다.
         
@@ -332,9 +506,12 @@ class EmailService:
             end_date (Optional[Union[datetime, str]], optional): 조회 종료 날짜.
                 datetime 객체 또는 ISO 8601 형식 문자열(예: '2025-03-11T23:59:59Z'). 기본값은 None.
             days (Optional[int], optional): 조회할 일수 (start_date가 None일 경우에만 사용). 기본값은 None.
-            limit (int, optional): 최대 결과 수. 기본값은 1000.
+            limit (int, optional): 폴더별 최대 결과 수. 기본값은 1000.
             filter_senders (bool, optional): 발신자 필터링 적용 여부. 기본값은 True.
             convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+            total_limit (Optional[int], optional): 두 폴더를 합친 최대 결과 수. 지정하면 limit 대신
+                사용하며, 폴더별로 절반씩 배정하되 한 폴더가 모자라면 남은 수를 다른 폴더에 배정합니다.
+                기본값은 None.
             
         Returns:
             Dict[str, List[EmailDto]]: 폴더별 이메일 DTO 리스트 (본문 포함)
@@ -344,42 +521,20 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 각 폴더별로 이메일 조회
-            inbox_emails = self.get_inbox_emails_with_body(
-                start_date=start_date,
-                end_date=end_date,
-                days=days,
-                limit=limit,
-                filter_senders=filter_senders,
-                convert_html_to_text=convert_html_to_text
-            )
-            
-            sent_emails = self.get_sent_emails_with_body(
-                start_date=start_date,
-                end_date=end_date,
-                days=days,
-                limit=limit,
-                filter_senders=filter_senders,
-                convert_html_to_text=convert_html_to_text
-            )
-            
-            # 결과 합치기
-            return {
-                'inbox': inbox_emails,
-                'sentItems': sent_emails
-            }
-            
-        except Exception as e:
-            # 오류 처리
-            logger.exception("모든 이메일 조회 중 오류 발생")
-            if isinstance(e, (EmailProcessingError, GraphApiError)):
-                raise
-            raise EmailProcessingError(f"모든 이메일 조회 중 오류 발생: {str(e)}")
+        return self._get_all_folder_emails(
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            include_body=True,
+            convert_html_to_text=convert_html_to_text,
+            total_limit=total_limit
+        )
     
     def get_delta_emails(
         self,
-        folder: str = "inbox",
+        folder: str = _FOLDER_INBOX,
         filter_senders: bool = True
     ) -> List[EmailDto]:
         """델타 쿼리로 변경된 이메일 목록을 조회합니다. (본문 제외)
@@ -395,33 +550,34 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정 (본문 제외)
-            processing_options = EmailProcessingOptions(
-                include_body=False,
-                apply_filters=filter_senders
-            )
-                
-            logger.debug(f"델타 쿼리 이메일 목록 조회: {folder}")
-            
-            # 델타 쿼리 요청
-            emails, next_link = self.graph_gateway.get_delta_messages(folder, processing_options)
-            
-            logger.info(f"델타 쿼리 이메일 목록 조회 완료: {len(emails)}개")
-            return emails
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
+        emails = list(self.iter_delta_emails(folder, filter_senders))
+        
+        logger.info("델타 쿼리 이메일 목록 조회 완료: %d개", len(emails))
+        return emails
+    
+    def iter_delta_emails(
+        self,
+        folder: str = _FOLDER_INBOX,
+        filter_senders: bool = True
+    ) -> Iterator[EmailDto]:
+        """델타 쿼리로 변경된 이메일 목록을 페이지 단위로 조회하며 하나씩 반환합니다. (본문 제외)
+        
+        Args:
+            folder (str, optional): 폴더. 기본값은 "inbox".
+            filter_senders (bool, optional): 발신자 필터링 적용 여부. 기본값은 True.
             
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("델타 쿼리 이메일 조회 중 오류 발생")
-            raise EmailProcessingError(f"델타 쿼리 이메일 조회 중 오류 발생: {str(e)}")
+        Yields:
+            EmailDto: 이메일 DTO
             
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        return self._iter_delta_emails(folder, filter_senders, include_body=False)
+    
     def get_delta_emails_with_body(
         self,
-        folder: str = "inbox",
+        folder: str = _FOLDER_INBOX,
         filter_senders: bool = True,
         convert_html_to_text: bool = True
     ) -> List[EmailDto]:
@@ -439,30 +595,85 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정 (본문 포함)
-            processing_options = EmailProcessingOptions(
-                include_body=True,
-                apply_filters=filter_senders,
-                convert_html_to_text=convert_html_to_text
-            )
-                
-            logger.debug(f"델타 쿼리 이메일 조회 (본문 포함): {folder}")
+        emails = list(self.iter_delta_emails_with_body(folder, filter_senders, convert_html_to_text))
+        
+        logger.info("델타 쿼리 이메일 조회 완료 (본문 포함): %d개", len(emails))
+        return emails
+    
+    def iter_delta_emails_with_body(
+        self,
+        folder: str = _FOLDER_INBOX,
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True
+    ) -> Iterator[EmailDto]:
+        """델타 쿼리로 변경된 이메일을 본문과 함께 페이지 단위로 조회하며 하나씩 반환합니다.
+        
+        Args:
+            folder (str, optional): 폴더. 기본값은 "inbox".
+            filter_senders (bool, optional): 발신자 필터링 적용 여부. 기본값은 True.
+            convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
             
-            # 델타 쿼리 요청
-            emails, next_link = self.graph_gateway.get_delta_messages(folder, processing_options)
+        Yields:
+            EmailDto: 이메일 DTO (본문 포함)
             
-            logger.info(f"델타 쿼리 이메일 조회 완료 (본문 포함): {len(emails)}개")
-            return emails
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        return self._iter_delta_emails(
+            folder,
+            filter_senders,
+            include_body=True,
+            convert_html_to_text=convert_html_to_text
+        )
+    
+    def refresh(
+        self,
+        folder: str = _FOLDER_INBOX,
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True
+    ) -> DeltaRefreshResult:
+        """저장된 델타 링크로 마지막 조회 이후 변경된 이메일만 가져옵니다.
+        
+        주기적인 폴링은 전체 목록 조회 대신 이 메서드를 사용합니다. 조회가 끝나면
+        새 델타 링크가 저장되어 다음 호출은 그 이후의 변경사항만 받습니다.
+        변경분이 많아 페이지 한도에서 중단되면 has_more가 True이며, 다음 호출이 이어서 받습니다.
+        델타 링크가 만료(410 Gone)된 경우 링크를 초기화하고 기본 범위의 전체 목록을
+        reset=True로 반환하며, 다음 호출에서 새 델타 쿼리를 시작합니다.
+        
+        Args:
+            folder (str, optional): 폴더. 기본값은 "inbox".
+            filter_senders (bool, optional): 발신자 필터링 적용 여부. 기본값은 True.
+            convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+            
+        Returns:
+            DeltaRefreshResult: 변경된 이메일 DTO 리스트 (본문 포함)와 초기화/추가 변경분 여부
             
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        try:
+            emails, next_link = self._get_delta_changes(folder, filter_senders, convert_html_to_text)
         except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
+            if e.status_code != 410:
+                raise
             
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("델타 쿼리 이메일 조회 중 오류 발생")
-            raise EmailProcessingError(f"델타 쿼리 이메일 조회 중 오류 발생: {str(e)}")
+            # 델타 링크 만료: 전체 목록으로 대체하고 초기화되었음을 알림
+            logger.warning("델타 링크 만료, 전체 목록 조회로 대체: %s", folder)
+            self._invalidate_list_cache()
+            emails = self._get_folder_emails(
+                folder,
+                days=Config.DEFAULT_DAYS,
+                limit=Config.DEFAULT_LIMIT,
+                filter_senders=filter_senders,
+                include_body=True,
+                convert_html_to_text=convert_html_to_text
+            )
+            return DeltaRefreshResult(emails=emails, reset=True)
+        
+        logger.info("델타 새로고침 완료: %s, 변경 %d개", folder, len(emails))
+        return DeltaRefreshResult(emails=emails, has_more=next_link is not None)
     
     def search_emails(
         self,
@@ -484,29 +695,7 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정 (본문 제외)
-            processing_options = EmailProcessingOptions(
-                include_body=False,
-                apply_filters=filter_senders
-            )
-                
-            logger.debug(f"이메일 목록 검색: '{search_term}', 폴더: {folder or '전체'}")
-            
-            # 검색 요청
-            emails = self.graph_gateway.search_messages(search_term, folder, processing_options)
-            
-            logger.info(f"이메일 목록 검색 완료: {len(emails)}개")
-            return emails
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
-            
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 검색 중 오류 발생")
-            raise EmailProcessingError(f"이메일 검색 중 오류 발생: {str(e)}")
+        return self._search_emails(search_term, folder, filter_senders, include_body=False)
     
     def search_emails_with_body(
         self,
@@ -530,31 +719,15 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정 (본문 포함)
-            processing_options = EmailProcessingOptions(
-                include_body=True,
-                apply_filters=filter_senders,
-                convert_html_to_text=convert_html_to_text
-            )
-                
-            logger.debug(f"이메일 검색 (본문 포함): '{search_term}', 폴더: {folder or '전체'}")
-            
-            # 검색 요청
-            emails = self.graph_gateway.search_messages(search_term, folder, processing_options)
-            
-            logger.info(f"이메일 검색 완료 (본문 포함): {len(emails)}개")
-            return emails
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
-            
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 검색 중 오류 발생")
-            raise EmailProcessingError(f"이메일 검색 중 오류 발생: {str(e)}")
+        return self._search_emails(
+            search_term,
+            folder,
+            filter_senders,
+            include_body=True,
+            convert_html_to_text=convert_html_to_text
+        )
     
+    @_graph_call("이메일 발송")
     def send_email(
         self,
         subject: str,
@@ -583,62 +756,51 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        from src.schemas.email import EmailParticipant
-        
-        try:
-            # 수신자 목록 변환
-            to_recipients = []
-            for email in recipients:
-                name = email.split('@')[0] if '@' in email else email
-                to_recipients.append(EmailParticipant(email=email, name=name, type="to"))
+        # 수신자 목록 변환
+        participant = EmailParticipant
+        to_recipients = [
+            participant(email, _display_name(email), _TYPE_TO)
+            for email in recipients
+        ]
+            
+        # 참조 수신자 목록 변환
+        cc_list = [
+            participant(email, _display_name(email), _TYPE_CC)
+            for email in cc_recipients or ()
+        ]
                 
-            # 참조 수신자 목록 변환
-            cc_list = []
-            if cc_recipients:
-                for email in cc_recipients:
-                    name = email.split('@')[0] if '@' in email else email
-                    cc_list.append(EmailParticipant(email=email, name=name, type="cc"))
-                    
-            # 숨은 참조 수신자 목록 변환
-            bcc_list = []
-            if bcc_recipients:
-                for email in bcc_recipients:
-                    name = email.split('@')[0] if '@' in email else email
-                    bcc_list.append(EmailParticipant(email=email, name=name, type="bcc"))
-            
-            # 발신자 정보는 사용하지 않음 (현재 인증된 사용자가 발신자가 됨)
-            sender = EmailParticipant(email="", name="", type="from")
-            
-            # 이메일 DTO 생성
-            email = EmailDto(
-                id="",  # 발송 시에는 ID 필요 없음
-                subject=subject,
-                body_content=body,
-                body_type=body_type,
-                sender=sender,
-                recipients=to_recipients,
-                cc_recipients=cc_list,
-                bcc_recipients=bcc_list,
-                importance=importance
-            )
-            
-            logger.debug(f"이메일 발송: '{subject}', 수신자 {len(to_recipients)}명")
-            
-            # 발송 요청
-            result = self.graph_gateway.send_message(email)
-            
-            logger.info(f"이메일 발송 완료: '{subject}'")
-            return result
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
-            
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 발송 중 오류 발생")
-            raise EmailProcessingError(f"이메일 발송 중 오류 발생: {str(e)}")
+        # 숨은 참조 수신자 목록 변환
+        bcc_list = [
+            participant(email, _display_name(email), _TYPE_BCC)
+            for email in bcc_recipients or ()
+        ]
+        
+        # 발신자 정보는 사용하지 않음 (현재 인증된 사용자가 발신자가 됨)
+        sender = EmailParticipant(email="", name="", type=_TYPE_FROM)
+        
+        # 이메일 DTO 생성
+        email = EmailDto(
+            id="",  # 발송 시에는 ID 필요 없음
+            subject=subject,
+            body_content=body,
+            body_type=body_type,
+            sender=sender,
+            recipients=to_recipients,
+            cc_recipients=cc_list,
+            bcc_recipients=bcc_list,
+            importance=importance
+        )
+        
+        logger.debug("이메일 발송: '%s', 수신자 %d명", subject, len(to_recipients))
+        
+        # 발송 요청
+        result = self.graph_gateway.send_message(email)
+        self._invalidate_list_cache()
+        
+        logger.info("이메일 발송 완료: '%s'", subject)
+        return result
     
+    @_graph_call("이메일 조회")
     def get_email(
         self,
         message_id: str,
@@ -657,29 +819,20 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            # 처리 옵션 설정
-            processing_options = EmailProcessingOptions(
-                include_attachments=include_attachments
-            )
-                
-            logger.debug(f"이메일 조회: ID={message_id}, 첨부파일 포함={include_attachments}")
-            
-            # 메시지 조회
-            email = self.graph_gateway.get_message(message_id, processing_options)
-            
-            logger.info(f"이메일 조회 완료: ID={message_id}")
-            return email
+        # 처리 옵션 설정
+        processing_options = EmailProcessingOptions(
+            include_attachments=include_attachments
+        )
             
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
-            
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 조회 중 오류 발생")
-            raise EmailProcessingError(f"이메일 조회 중 오류 발생: {str(e)}")
+        logger.debug("이메일 조회: ID=%s, 첨부파일 포함=%s", message_id, include_attachments)
+        
+        # 메시지 조회
+        email = self.graph_gateway.get_message(message_id, processing_options)
+        
+        logger.info("이메일 조회 완료: ID=%s", message_id)
+        return email
     
+    @_graph_call("이메일 읽음 표시")
     def mark_as_read(self, message_id: str) -> bool:
         """이메일을 읽음으로 표시합니다.
         
@@ -693,23 +846,14 @@ class EmailService:
             EmailProcessingError: 이메일 처리 오류 시
             GraphApiError: Graph API 요청 실패 시
         """
-        try:
-            logger.debug(f"이메일 읽음 표시: ID={message_id}")
-            
-            # 읽음 표시 요청
-            result = self.graph_gateway.mark_as_read(message_id)
-            
-            logger.info(f"이메일 읽음 표시 완료: ID={message_id}")
-            return result
-            
-        except GraphApiError as e:
-            # Graph API 오류는 그대로 전파
-            raise
-            
-        except Exception as e:
-            # 기타 오류는 EmailProcessingError로 변환
-            logger.exception("이메일 읽음 표시 중 오류 발생")
-            raise EmailProcessingError(f"이메일 읽음 표시 중 오류 발생: {str(e)}")
+        logger.debug("이메일 읽음 표시: ID=%s", message_id)
+        
+        # 읽음 표시 요청
+        result = self.graph_gateway.mark_as_read(message_id)
+        self._invalidate_list_cache()
+        
+        logger.info("이메일 읽음 표시 완료: ID=%s", message_id)
+        return result
     
     def add_filter_sender(self, sender: str) -> None:
         """필터링할 발신자를 추가합니다.
@@ -718,7 +862,7 @@ class EmailService:
             sender (str): 추가할 발신자
         """
         Config.add_filter_sender(sender)
-        logger.info(f"필터링할 발신자 추가됨: {sender}")
+        logger.info("필터링할 발신자 추가됨: %s", sender)
     
     def remove_filter_sender(self, sender: str) -> bool:
         """필터링할 발신자를 제거합니다.
@@ -731,9 +875,9 @@ class EmailService:
         """
         result = Config.remove_filter_sender(sender)
         if result:
-            logger.info(f"필터링할 발신자 제거됨: {sender}")
+            logger.info("필터링할 발신자 제거됨: %s", sender)
         else:
-            logger.warning(f"필터링할 발신자 제거 실패 (없음): {sender}")
+            logger.warning("필터링할 발신자 제거 실패 (없음): %s", sender)
         return result
     
     def get_filter_senders(self) -> List[str]:
@@ -743,3 +887,390 @@ class EmailService:
             List[str]: 필터링할 발신자 목록
         """
         return Config.get_filter_senders()
+    
+    def _build_filter(
+        self,
+        folder: str,
+        *,
+        limit: int,
+        filter_senders: bool,
+        days: Optional[int] = None,
+        start_date: Optional[Union[datetime, str]] = None,
+        end_date: Optional[Union[datetime, str]] = None
+    ) -> EmailFilter:
+        """폴더 조회용 필터 옵션을 생성합니다.
+        
+        날짜는 직접 지정된 start_date가 days 파라미터보다 우선합니다.
+        문자열 날짜는 EmailFilter에서 datetime으로 변환됩니다.
+        
+        Args:
+            folder (str): 폴더 (inbox, sentItems 등)
+            limit (int): 최대 결과 수
+            filter_senders (bool): 발신자 필터링 적용 여부
+            days (Optional[int], optional): 조회할 일수. 기본값은 None.
+            start_date (Optional[Union[datetime, str]], optional): 조회 시작 날짜. 기본값은 None.
+            end_date (Optional[Union[datetime, str]], optional): 조회 종료 날짜. 기본값은 None.
+        
+        Returns:
+            EmailFilter: 필터 옵션
+        """
+        if start_date is None and days is not None:
+            start_date = _now_second_bucket(int(time.time())) - timedelta(days=days)
+        
+        return EmailFilter(
+            folder=folder,
+            limit=limit,
+            exclude_senders=Config.get_filter_senders_set() if filter_senders else frozenset(),
+            start_date=start_date,
+            end_date=end_date
+        )
+    
+    def _get_folder_emails(self, folder: str, **kwargs) -> List[EmailDto]:
+        """폴더의 이메일을 조회하여 리스트로 반환합니다.
+        
+        Args:
+            folder (str): 폴더 (inbox, sentItems 등)
+            **kwargs: _iter_folder_emails()에 전달할 인자
+        
+        Returns:
+            List[EmailDto]: 이메일 DTO 리스트
+        
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        cache_key = (
+            "folder", folder, self._senders_key(kwargs["filter_senders"]),
+            _minute_bucket(kwargs.get("days")), tuple(sorted(kwargs.items()))
+        )
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return _copy_emails(cached)
+            
+        # 캐시에는 원본을 보관하고 호출자에게는 사본을 반환
+        emails = list(self._iter_folder_emails(folder, **kwargs))
+        self._put_cached(cache_key, emails)
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("%s 완료: %d개", _query_label(folder, kwargs.get('include_body', False)), len(emails))
+        return _copy_emails(emails)
+    
+    @_graph_call("이메일 조회")
+    def _iter_folder_emails(
+        self,
+        folder: str,
+        *,
+        limit: int,
+        filter_senders: bool,
+        days: Optional[int] = None,
+        start_date: Optional[Union[datetime, str]] = None,
+        end_date: Optional[Union[datetime, str]] = None,
+        include_body: bool = False,
+        convert_html_to_text: bool = True,
+        body_preview_only: bool = False
+    ) -> Iterator[EmailDto]:
+        """폴더의 이메일을 조회하며 하나씩 반환합니다.
+        
+        Args:
+            folder (str): 폴더 (inbox, sentItems 등)
+            limit (int): 최대 결과 수
+            filter_senders (bool): 발신자 필터링 적용 여부
+            days (Optional[int], optional): 조회할 일수 (start_date가 None일 경우에만 사용). 기본값은 None.
+            start_date (Optional[Union[datetime, str]], optional): 조회 시작 날짜. 기본값은 None.
+            end_date (Optional[Union[datetime, str]], optional): 조회 종료 날짜. 기본값은 None.
+            include_body (bool, optional): 본문 포함 여부. 기본값은 False.
+            convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+            body_preview_only (bool, optional): 본문 대신 bodyPreview만 조회할지 여부. 기본값은 False.
+        
+        Yields:
+            EmailDto: 이메일 DTO
+        
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        processing_options = _processing_options(include_body, filter_senders, convert_html_to_text, body_preview_only)
+        filter_options = self._build_filter(
+            folder,
+            limit=limit,
+            filter_senders=filter_senders,
+            days=days,
+            start_date=start_date,
+            end_date=end_date
+        )
+        
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("%s: %s일, 최대 %s개", _query_label(folder, include_body), days, filter_options.limit)
+        
+        # 메시지 조회 (기본은 nextLink 페이지 단위, 설정 시 많은 양은 범위별 병렬 조회)
+        if Config.PARALLEL_FETCH and filter_options.limit >= _PARALLEL_FETCH_MIN_LIMIT:
+            yield from self.graph_gateway.iter_messages_parallel(filter_options, processing_options)
+        else:
+            yield from self.graph_gateway.iter_messages(filter_options, processing_options)
+    
+    @_graph_call("모든 이메일 조회")
+    def _get_all_folder_emails(
+        self,
+        *,
+        limit: int,
+        filter_senders: bool,
+        days: Optional[int] = None,
+        start_date: Optional[Union[datetime, str]] = None,
+        end_date: Optional[Union[datetime, str]] = None,
+        include_body: bool = False,
+        convert_html_to_text: bool = True,
+        total_limit: Optional[int] = None
+    ) -> Dict[str, List[EmailDto]]:
+        """수신함과 송신함의 이메일을 $batch 요청 한 번으로 조회합니다.
+        
+        Args:
+            limit (int): 폴더별 최대 결과 수 (total_limit이 지정되면 무시)
+            filter_senders (bool): 발신자 필터링 적용 여부
+            days (Optional[int], optional): 조회할 일수 (start_date가 None일 경우에만 사용). 기본값은 None.
+            start_date (Optional[Union[datetime, str]], optional): 조회 시작 날짜. 기본값은 None.
+            end_date (Optional[Union[datetime, str]], optional): 조회 종료 날짜. 기본값은 None.
+            include_body (bool, optional): 본문 포함 여부. 기본값은 False.
+            convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+            total_limit (Optional[int], optional): 두 폴더를 합친 최대 결과 수. 지정하면 폴더별로
+                자신의 몫만 조회하고, 한 폴더가 몫을 채우지 못하면 다른 폴더를 남은 수만큼 다시 조회합니다.
+                기본값은 None.
+        
+        Returns:
+            Dict[str, List[EmailDto]]: 폴더별 이메일 DTO 리스트
+                {'inbox': [...], 'sentItems': [...]}
+        
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        label = "모든 이메일 조회 (본문 포함)" if include_body else "모든 이메일 목록 조회"
+        
+        # 전체 할당량이 없으면 요청하지 않음
+        if total_limit is not None and total_limit <= 0:
+            return {_FOLDER_INBOX: [], _FOLDER_SENT: []}
+            
+        cache_key = (
+            "all", self._senders_key(filter_senders), limit, days, _minute_bucket(days),
+            start_date, end_date, include_body, convert_html_to_text, total_limit
+        )
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return {folder: _copy_emails(emails) for folder, emails in cached.items()}
+            
+        processing_options = _processing_options(include_body, filter_senders, convert_html_to_text)
+        
+        # 폴더별 조회 개수 (전체 할당량이 있으면 폴더별 몫만 조회)
+        if total_limit is not None:
+            inbox_limit, sent_limit = _split_budget(total_limit)
+        else:
+            inbox_limit = sent_limit = limit
+            
+        # 필터 옵션 설정 (송신함은 폴더와 조회 개수만 다름)
+        inbox_filter = self._build_filter(
+            _FOLDER_INBOX,
+            limit=inbox_limit,
+            filter_senders=filter_senders,
+            days=days,
+            start_date=start_date,
+            end_date=end_date
+        )
+        sent_filter = replace(inbox_filter, folder=_FOLDER_SENT, limit=sent_limit)
+        
+        logger.debug("%s: %s일, 최대 %s개", label, days, total_limit or limit)
+        
+        # 수신함/송신함을 $batch 요청 한 번으로 조회 (할당량이 없는 폴더는 제외)
+        if sent_limit > 0:
+            inbox_emails, sent_emails = self.graph_gateway.batch_get_messages(
+                [inbox_filter, sent_filter], processing_options
+            )
+        else:
+            inbox_emails = self.graph_gateway.get_messages(inbox_filter, processing_options)
+            sent_emails = []
+            
+        if total_limit is not None:
+            # 한 폴더가 몫을 채우지 못하면 남은 수만큼 다른 폴더를 추가로 조회
+            if len(inbox_emails) < inbox_limit and len(sent_emails) >= sent_limit:
+                sent_emails = self.graph_gateway.get_messages(
+                    replace(sent_filter, limit=total_limit - len(inbox_emails)), processing_options
+                )
+            elif len(sent_emails) < sent_limit and len(inbox_emails) >= inbox_limit:
+                inbox_emails = self.graph_gateway.get_messages(
+                    replace(inbox_filter, limit=total_limit - len(sent_emails)), processing_options
+                )
+        
+        logger.info("%s 완료: 수신함 %d개, 송신함 %d개", label, len(inbox_emails), len(sent_emails))
+        
+        # 결과 합치기
+        result = {
+            _FOLDER_INBOX: inbox_emails,
+            _FOLDER_SENT: sent_emails
+        }
+        self._put_cached(cache_key, result)
+        return {folder: _copy_emails(emails) for folder, emails in result.items()}
+    
+    @_graph_call("델타 쿼리 이메일 조회")
+    def _iter_delta_emails(
+        self,
+        folder: str,
+        filter_senders: bool,
+        include_body: bool,
+        convert_html_to_text: bool = True
+    ) -> Iterator[EmailDto]:
+        """델타 쿼리로 변경된 이메일을 조회하며 하나씩 반환합니다.
+        
+        Args:
+            folder (str): 폴더
+            filter_senders (bool): 발신자 필터링 적용 여부
+            include_body (bool): 본문 포함 여부
+            convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+        
+        Yields:
+            EmailDto: 이메일 DTO
+        
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        processing_options = _processing_options(include_body, filter_senders, convert_html_to_text)
+        
+        logger.debug("델타 쿼리 이메일 %s: %s", "조회 (본문 포함)" if include_body else "목록 조회", folder)
+        
+        # 델타 쿼리 요청 (페이지 단위), 변경사항이 있으면 목록 캐시 무효화
+        changed = False
+        for email in self.graph_gateway.iter_delta_messages(folder, processing_options):
+            if not changed:
+                self._invalidate_list_cache()
+                changed = True
+            yield email
+    
+    @_graph_call("델타 쿼리 이메일 조회")
+    def _get_delta_changes(
+        self,
+        folder: str,
+        filter_senders: bool,
+        convert_html_to_text: bool
+    ) -> Tuple[List[EmailDto], Optional[str]]:
+        """저장된 델타 링크로 변경된 이메일을 본문과 함께 조회합니다. (페이지 수 제한)
+        
+        Args:
+            folder (str): 폴더
+            filter_senders (bool): 발신자 필터링 적용 여부
+            convert_html_to_text (bool): HTML 본문을 텍스트로 변환할지 여부
+        
+        Returns:
+            Tuple[List[EmailDto], Optional[str]]: 이메일 DTO 리스트와, 페이지 한도로 중단된 경우 이어서 조회할 링크
+        
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시 (델타 링크 만료 시 상태 코드 410)
+        """
+        processing_options = _processing_options(True, filter_senders, convert_html_to_text)
+        
+        emails, next_link = self.graph_gateway.get_delta_changes(
+            folder, processing_options, restart_expired=False
+        )
+        
+        # 변경사항이 있으면 목록 캐시 무효화
+        if emails:
+            self._invalidate_list_cache()
+        return emails, next_link
+    
+    @_graph_call("이메일 검색")
+    def _search_emails(
+        self,
+        search_term: str,
+        folder: Optional[str],
+        filter_senders: bool,
+        include_body: bool,
+        convert_html_to_text: bool = True
+    ) -> List[EmailDto]:
+        """이메일을 검색합니다.
+        
+        Args:
+            search_term (str): 검색어
+            folder (Optional[str]): 폴더 (None이면 전체)
+            filter_senders (bool): 발신자 필터링 적용 여부
+            include_body (bool): 본문 포함 여부
+            convert_html_to_text (bool, optional): HTML 본문을 텍스트로 변환할지 여부. 기본값은 True.
+        
+        Returns:
+            List[EmailDto]: 이메일 DTO 리스트
+        
+        Raises:
+            EmailProcessingError: 이메일 처리 오류 시
+            GraphApiError: Graph API 요청 실패 시
+        """
+        label = "이메일 검색 (본문 포함)" if include_body else "이메일 목록 검색"
+        
+        cache_key = ("search", search_term, folder, self._senders_key(filter_senders), include_body, convert_html_to_text)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            return _copy_emails(cached)
+            
+        processing_options = _processing_options(include_body, filter_senders, convert_html_to_text)
+        
+        logger.debug("%s: '%s', 폴더: %s", label, search_term, folder or '전체')
+        
+        # 검색 요청
+        emails = self.graph_gateway.search_messages(search_term, folder, processing_options)
+        self._put_cached(cache_key, emails)
+        
+        logger.info("%s 완료: %d개", label, len(emails))
+        return _copy_emails(emails)
+    
+    def _senders_key(self, filter_senders: bool) -> FrozenSet[str]:
+        """캐시 키에 사용할 필터링 발신자 집합을 반환합니다.
+        
+        발신자 목록이 바뀌면 캐시 키도 달라지므로 이전 결과를 사용하지 않습니다.
+        
+        Args:
+            filter_senders (bool): 발신자 필터링 적용 여부
+            
+        Returns:
+            FrozenSet[str]: 필터링할 발신자 집합 (필터링하지 않으면 빈 집합)
+        """
+        return Config.get_filter_senders_set() if filter_senders else frozenset()
+    
+    def _get_cached(self, key: Tuple[Any, ...]) -> Optional[Any]:
+        """캐시된 목록/검색 결과를 조회합니다.
+        
+        Args:
+            key (Tuple[Any, ...]): 캐시 키
+            
+        Returns:
+            Optional[Any]: 유효 시간 내의 결과, 없거나 만료된 경우 None
+        """
+        with self._list_cache_lock:
+            entry = self._list_cache.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] >= _LIST_CACHE_TTL:
+                del self._list_cache[key]
+                return None
+            logger.debug("목록 캐시 사용: %s", key[0])
+            return entry[1]
+    
+    def _put_cached(self, key: Tuple[Any, ...], value: Any) -> None:
+        """목록/검색 결과를 캐시에 저장합니다.
+        
+        캐시가 가득 차면 만료된 항목을 먼저 지우고, 그래도 가득 차 있으면
+        가장 오래된 항목을 지웁니다.
+        
+        Args:
+            key (Tuple[Any, ...]): 캐시 키
+            value (Any): 저장할 결과
+        """
+        now = time.monotonic()
+        with self._list_cache_lock:
+            if key not in self._list_cache and len(self._list_cache) >= _LIST_CACHE_MAXSIZE:
+                expired = [k for k, (stored_at, _) in self._list_cache.items() if now - stored_at >= _LIST_CACHE_TTL]
+                for k in expired:
+                    del self._list_cache[k]
+                if len(self._list_cache) >= _LIST_CACHE_MAXSIZE:
+                    del self._list_cache[next(iter(self._list_cache))]
+            self._list_cache[key] = (now, value)
+    
+    def _invalidate_list_cache(self) -> None:
+        """메일함 변경(발송, 읽음 표시, 델타 변경사항) 후 목록/검색 캐시를 비웁니다."""
+        with self._list_cache_lock:
+            self._list_cache.clear()
@@ -0,0 +1,293 @@
+"""스레드 풀 이메일 서비스 모듈
+
+이 모듈은 동기 EmailService 호출을 스레드 풀로 넘겨 await할 수 있게 하는 래퍼를 제공합니다.
+Graph API 요청 자체는 동기 게이트웨이에서 블로킹 I/O로 수행되며, 스레드 풀에서 실행하여
+이벤트 루프(FastAPI 등)를 막지 않을 뿐입니다. 네이티브 비동기 HTTP 클라이언트는 사용하지 않습니다.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import Any, Callable, Dict, List, Optional, TypeVar, Union
+from datetime import datetime
+
+from src.utils.logging_config import LoggerFactory
+from src.infra.config import Config
+from src.services.email_service import EmailService
+from src.schemas.email import DeltaRefreshResult, EmailDto
+
+
+# 로거 설정
+logger = LoggerFactory.get_logger(__name__)
+
+T = TypeVar("T")
+
+
+class ThreadedEmailService:
+    """스레드 풀 이메일 서비스 클래스
+
+    EmailService의 I/O 메서드를 스레드 풀에서 실행하는 async def 메서드로 제공합니다.
+    각 호출은 스레드 하나를 점유하는 동기 요청이므로 동시 요청 수는 스레드 풀 크기로 제한됩니다.
+    인자, 반환값, 예외는 같은 이름의 EmailService 메서드와 같습니다.
+    """
+
+    def __init__(self, email_service: Optional[EmailService] = None, max_workers: Optional[int] = None):
+        """초기화 메소드
+
+        Args:
+            email_service (Optional[EmailService], optional): 감쌀 이메일 서비스.
+                지정하지 않으면 기본 인스턴스 생성.
+            max_workers (Optional[int], optional): 스레드 풀 크기 (동시에 실행할 최대 요청 수).
+                지정하지 않으면 Config.EMAIL_SERVICE_WORKERS 사용.
+        """
+        self.email_service = email_service or EmailService()
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers or Config.EMAIL_SERVICE_WORKERS,
+            thread_name_prefix="graph-api"
+        )
+
+        logger.debug("ThreadedEmailService 초기화 완료")
+
+    async def _run(self, func: Callable[..., T], **kwargs: Any) -> T:
+        """동기 메서드를 스레드 풀에서 실행하고 결과를 기다립니다.
+
+        Args:
+            func (Callable[..., T]): 실행할 메서드
+            **kwargs: 메서드에 전달할 인자
+
+        Returns:
+            T: 메서드 반환값
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, partial(func, **kwargs))
+
+    async def get_inbox_emails(
+        self,
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        filter_senders: bool = True
+    ) -> List[EmailDto]:
+        """수신함 이메일 목록을 조회합니다. (본문 제외)"""
+        return await self._run(
+            self.email_service.get_inbox_emails,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders
+        )
+
+    async def get_sent_emails(
+        self,
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        filter_senders: bool = True
+    ) -> List[EmailDto]:
+        """송신함 이메일 목록을 조회합니다. (본문 제외)"""
+        return await self._run(
+            self.email_service.get_sent_emails,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders
+        )
+
+    async def get_all_emails(
+        self,
+        days: Optional[int] = None,
+        limit: Optional[int] = None,
+        filter_senders: bool = True,
+        total_limit: Optional[int] = None
+    ) -> Dict[str, List[EmailDto]]:
+        """모든 이메일(수신함, 송신함) 목록을 조회합니다. (본문 제외)"""
+        return await self._run(
+            self.email_service.get_all_emails,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            total_limit=total_limit
+        )
+
+    async def get_inbox_emails_with_body(
+        self,
+        start_date: Optional[Union[datetime, str]] = None,
+        end_date: Optional[Union[datetime, str]] = None,
+        days: Optional[int] = None,
+        limit: int = 1000,
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True,
+        body_preview_only: bool = False
+    ) -> List[EmailDto]:
+        """수신함 이메일을 본문과 함께 조회합니다."""
+        return await self._run(
+            self.email_service.get_inbox_emails_with_body,
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            convert_html_to_text=convert_html_to_text,
+            body_preview_only=body_preview_only
+        )
+
+    async def get_sent_emails_with_body(
+        self,
+        start_date: Optional[Union[datetime, str]] = None,
+        end_date: Optional[Union[datetime, str]] = None,
+        days: Optional[int] = None,
+        limit: int = 1000,
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True
+    ) -> List[EmailDto]:
+        """송신함 이메일을 본문과 함께 조회합니다."""
+        return await self._run(
+            self.email_service.get_sent_emails_with_body,
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            convert_html_to_text=convert_html_to_text
+        )
+
+    async def get_all_emails_with_body(
+        self,
+        start_date: Optional[Union[datetime, str]] = None,
+        end_date: Optional[Union[datetime, str]] = None,
+        days: Optional[int] = None,
+        limit: int = 1000,
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True,
+        total_limit: Optional[int] = None
+    ) -> Dict[str, List[EmailDto]]:
+        """모든 이메일(수신함, 송신함)을 본문과 함께 조회합니다.
+
+        두 폴더는 EmailService에서 $batch 요청 한 번으로 함께 조회됩니다.
+        """
+        return await self._run(
+            self.email_service.get_all_emails_with_body,
+            start_date=start_date,
+            end_date=end_date,
+            days=days,
+            limit=limit,
+            filter_senders=filter_senders,
+            convert_html_to_text=convert_html_to_text,
+            total_limit=total_limit
+        )
+
+    async def get_delta_emails(
+        self,
+        folder: str = "inbox",
+        filter_senders: bool = True
+    ) -> List[EmailDto]:
+        """델타 쿼리로 변경된 이메일 목록을 조회합니다. (본문 제외)"""
+        return await self._run(
+            self.email_service.get_delta_emails,
+            folder=folder,
+            filter_senders=filter_senders
+        )
+
+    async def get_delta_emails_with_body(
+        self,
+        folder: str = "inbox",
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True
+    ) -> List[EmailDto]:
+        """델타 쿼리로 변경된 이메일을 본문과 함께 조회합니다."""
+        return await self._run(
+            self.email_service.get_delta_emails_with_body,
+            folder=folder,
+            filter_senders=filter_senders,
+            convert_html_to_text=convert_html_to_text
+        )
+
+    async def refresh(
+        self,
+        folder: str = "inbox",
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True
+    ) -> DeltaRefreshResult:
+        """저장된 델타 링크로 마지막 조회 이후 변경된 이메일만 가져옵니다."""
+        return await self._run(
+            self.email_service.refresh,
+            folder=folder,
+            filter_senders=filter_senders,
+            convert_html_to_text=convert_html_to_text
+        )
+
+    async def search_emails(
+        self,
+        search_term: str,
+        folder: Optional[str] = None,
+        filter_senders: bool = True
+    ) -> List[EmailDto]:
+        """이메일 목록을 검색합니다. (본문 제외)"""
+        return await self._run(
+            self.email_service.search_emails,
+            search_term=search_term,
+            folder=folder,
+            filter_senders=filter_senders
+        )
+
+    async def search_emails_with_body(
+        self,
+        search_term: str,
+        folder: Optional[str] = None,
+        filter_senders: bool = True,
+        convert_html_to_text: bool = True
+    ) -> List[EmailDto]:
+        """이메일을 본문과 함께 검색합니다."""
+        return await self._run(
+            self.email_service.search_emails_with_body,
+            search_term=search_term,
+            folder=folder,
+            filter_senders=filter_senders,
+            convert_html_to_text=convert_html_to_text
+        )
+
+    async def send_email(
+        self,
+        subject: str,
+        body: str,
+        recipients: List[str],
+        cc_recipients: Optional[List[str]] = None,
+        bcc_recipients: Optional[List[str]] = None,
+        body_type: str = "html",
+        importance: str = "normal"
+    ) -> bool:
+        """이메일을 전송합니다."""
+        return await self._run(
+            self.email_service.send_email,
+            subject=subject,
+            body=body,
+            recipients=recipients,
+            cc_recipients=cc_recipients,
+            bcc_recipients=bcc_recipients,
+            body_type=body_type,
+            importance=importance
+        )
+
+    async def get_email(
+        self,
+        message_id: str,
+        include_attachments: bool = False
+    ) -> EmailDto:
+        """특정 이메일을 조회합니다."""
+        return await self._run(
+            self.email_service.get_email,
+            message_id=message_id,
+            include_attachments=include_attachments
+        )
+
+    async def mark_as_read(self, message_id: str) -> bool:
+        """이메일을 읽음으로 표시합니다."""
+        return await self._run(self.email_service.mark_as_read, message_id=message_id)
+
+    def add_filter_sender(self, sender: str) -> None:
+        """필터링할 발신자를 추가합니다. (설정만 변경하므로 동기 메서드)"""
+        self.email_service.add_filter_sender(sender)
+
+    def remove_filter_sender(self, sender: str) -> bool:
+        """필터링할 발신자를 제거합니다. (설정만 변경하므로 동기 메서드)"""
+        return self.email_service.remove_filter_sender(sender)
+
+    def get_filter_senders(self) -> List[str]:
+        """필터링할 발신자 목록을 반환합니다."""
+        return self.email_service.get_filter_senders()
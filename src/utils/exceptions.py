@@ -23,19 +23,24 @@ class BaseError(Exception):
         """
         self.message = message
         self.details = details or {}
+        self._str = None
         super().__init__(self.message)
     
     def __str__(self):
         """문자열 표현 메소드
         
+        처음 호출될 때 만든 문자열을 저장해 두고 이후에는 재사용합니다.
+        
         Returns:
             str: 예외 메시지 문자열
         """
-        if not self.details:
-            return self.message
-            
-        details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
-        return f"{self.message} ({details_str})"
+        if self._str is None:
+            if not self.details:
+                self._str = self.message
+            else:
+                details_str = ", ".join(f"{k}={v}" for k, v in self.details.items())
+                self._str = f"{self.message} ({details_str})"
+        return self._str
 
 
 class ConfigurationError(BaseError):
@@ -104,9 +109,10 @@ class GraphApiError(BaseError):
         status_code (int): HTTP 상태 코드
         error_code (str): Graph API 오류 코드
         request_id (str): 요청 ID
+        retry_after (int): 재시도까지 대기할 시간(초), Retry-After 헤더 값
     """
 
-    def __init__(self, message, status_code=None, error_code=None, request_id=None, details=None):
+    def __init__(self, message, status_code=None, error_code=None, request_id=None, details=None, retry_after=None):
         """초기화 메소드
         
         Args:
@@ -115,6 +121,7 @@ class GraphApiError(BaseError):
             error_code (str, optional): Graph API 오류 코드. 기본값은 None.
             request_id (str, optional): 요청 ID. 기본값은 None.
             details (dict, optional): 추가 오류 상세 정보. 기본값은 None.
+            retry_after (int, optional): 재시도까지 대기할 시간(초). 기본값은 None.
         """
         super_details = details or {}
         
@@ -127,11 +134,15 @@ class GraphApiError(BaseError):
         if request_id:
             super_details["request_id"] = request_id
             
+        if retry_after:
+            super_details["retry_after"] = retry_after
+            
         super().__init__(message, super_details)
         
         self.status_code = status_code
         self.error_code = error_code
         self.request_id = request_id
+        self.retry_after = retry_after
 
 
 class EmailProcessingError(BaseError):
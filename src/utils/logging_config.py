@@ -5,9 +5,74 @@
 
 import os
 import sys
+import atexit
+import queue
 import logging
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+# 로그 포맷(LoggerFactory._log_format)에서 사용하지 않는 LogRecord 필드 수집 비활성화
+# (포맷에 %(thread)d, %(process)d, %(processName)s 등을 추가할 경우 해당 설정을 다시 켜야 합니다)
+logging.logThreads = False
+logging.logProcesses = False
+logging.logMultiprocessing = False
+
+
+class FastRotatingHandler(RotatingFileHandler):
+    """os.write로 레코드를 기록하는 순환 파일 핸들러
+
+    파일을 O_APPEND 모드의 비버퍼 바이너리 스트림으로 열어 레코드마다 write 한 번으로 기록하고,
+    순환 시 이전 파일의 페이지 캐시를 해제하도록 커널에 알립니다 (posix_fadvise 지원 시).
+    순환 여부는 파일 위치를 조회하지 않고 기록한 바이트 수로 판단하므로,
+    순환 직전 파일은 maxBytes를 레코드 하나 크기만큼 넘을 수 있습니다.
+    """
+
+    def _open(self):
+        """로그 파일을 추가 쓰기 전용으로 열고 기록 바이트 수를 현재 파일 크기로 초기화합니다.
+
+        Returns:
+            io.FileIO: 비버퍼 바이너리 스트림
+        """
+        fd = os.open(self.baseFilename, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        self._bytes_written = os.fstat(fd).st_size
+        return os.fdopen(fd, "wb", buffering=0)
+
+    def shouldRollover(self, record):
+        """기록한 바이트 수가 maxBytes에 도달했는지 확인합니다.
+
+        Args:
+            record (logging.LogRecord): 로그 레코드
+
+        Returns:
+            bool: 순환이 필요하면 True
+        """
+        return self.maxBytes > 0 and self.stream is not None and self._bytes_written >= self.maxBytes
+
+    def emit(self, record):
+        """레코드를 포맷팅하여 파일에 기록합니다.
+
+        Args:
+            record (logging.LogRecord): 로그 레코드
+        """
+        try:
+            if self.shouldRollover(record):
+                self.doRollover()
+            if self.stream is None:
+                self.stream = self._open()
+            data = (self.format(record) + self.terminator).encode(self.encoding or "utf-8")
+            self._bytes_written += os.write(self.stream.fileno(), data)
+        except Exception:
+            self.handleError(record)
+
+    def doRollover(self):
+        """로그 파일을 순환하고 이전 파일의 페이지 캐시를 해제합니다."""
+        # 이미 기록된 데이터는 다시 읽지 않으므로 캐시에서 제거
+        if self.stream is not None and hasattr(os, "posix_fadvise"):
+            try:
+                os.posix_fadvise(self.stream.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+            except OSError:
+                pass
+        super().doRollover()
 
 
 class LoggerFactory:
@@ -16,14 +81,12 @@ class LoggerFactory:
     애플리케이션 전체에서 사용되는 로거 인스턴스를 관리합니다.
     """
 
-    # 로거 인스턴스를 저장하는 딕셔너리
-    _loggers = {}
-    
     # 기본 로그 디렉토리
     _log_dir = Path(os.path.dirname(os.path.dirname(os.path.dirname(__file__)))) / "logs"
     
-    # 로그 파일 경로
+    # 로그 파일 경로 (핸들러 생성 시 사용할 문자열 경로도 미리 계산)
     _log_file = _log_dir / "app.log"
+    _log_file_str = str(_log_file)
     
     # 로그 포맷
     _log_format = "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
@@ -31,12 +94,21 @@ class LoggerFactory:
     # 로그 레벨
     _log_level = os.environ.get("LOG_LEVEL", "INFO").upper()
     
+    # 로그 레벨 상수와 포맷터 캐시 (레벨은 set_log_level() 호출 시 갱신)
+    _cached_level = getattr(logging, _log_level, logging.INFO)
+    _cached_formatter = logging.Formatter(_log_format)
+    
+    # get_logger()로 생성한 로거 이름 (set_log_level()은 이 로거들의 레벨만 변경)
+    _logger_names = set()
+    
+    # 실제 출력 핸들러(콘솔, 파일)를 백그라운드 스레드에서 실행하는 큐 리스너
+    _listener = None
+    
     @classmethod
     def initialize(cls):
         """로깅 시스템을 초기화합니다."""
-        # 로그 디렉토리가 없으면 생성
-        if not cls._log_dir.exists():
-            cls._log_dir.mkdir(parents=True, exist_ok=True)
+        # 로그 디렉토리 생성 (이미 있으면 무시)
+        cls._log_dir.mkdir(parents=True, exist_ok=True)
         
         # 루트 로거 설정
         root_logger = logging.getLogger()
@@ -44,43 +116,47 @@ class LoggerFactory:
         
         # 콘솔 핸들러 설정
         console_handler = logging.StreamHandler(sys.stdout)
-        console_handler.setLevel(cls._get_log_level())
         console_handler.setFormatter(cls._get_formatter())
         
         # 파일 핸들러 설정 (로그 파일 순환)
-        file_handler = RotatingFileHandler(
-            cls._log_file, maxBytes=10*1024*1024, backupCount=5, encoding="utf-8"
+        file_handler = FastRotatingHandler(
+            cls._log_file_str, maxBytes=10*1024*1024, backupCount=5, encoding="utf-8"
         )
-        file_handler.setLevel(cls._get_log_level())
         file_handler.setFormatter(cls._get_formatter())
         
-        # 핸들러 추가
-        root_logger.addHandler(console_handler)
-        root_logger.addHandler(file_handler)
+        # 출력 핸들러는 큐 리스너 스레드에서 실행하고, 루트 로거에는 큐 핸들러만 추가
+        # (호출 스레드는 LogRecord를 큐에 넣기만 하고 포맷팅과 파일 I/O는 리스너가 처리)
+        # 레벨 필터링은 큐 핸들러에서만 하므로 레벨 변경 전에 큐에 들어간 레코드도 출력됨
+        log_queue = queue.SimpleQueue()
+        cls._listener = QueueListener(
+            log_queue, console_handler, file_handler, respect_handler_level=True
+        )
+        cls._listener.start()
         
-        # 로깅 초기화 완료 로그
-        cls.get_logger(__name__).debug(f"로깅 시스템 초기화 완료 (레벨: {cls._log_level})")
+        # 종료 시 큐에 남은 레코드를 모두 기록
+        atexit.register(cls._listener.stop)
+        
+        queue_handler = QueueHandler(log_queue)
+        queue_handler.setLevel(cls._get_log_level())
+        root_logger.addHandler(queue_handler)
     
     @classmethod
     def get_logger(cls, name):
         """지정된 이름의 로거 인스턴스를 반환합니다.
         
+        로거 인스턴스는 logging 모듈이 이름별로 캐시하므로 이름만 기록합니다.
+        
         Args:
             name (str): 로거 이름
             
         Returns:
             logging.Logger: 로거 인스턴스
         """
-        if name not in cls._loggers:
-            logger = logging.getLogger(name)
+        logger = logging.getLogger(name)
+        if name not in cls._logger_names:
             logger.setLevel(cls._get_log_level())
-            cls._loggers[name] = logger
-            
-            # 로거 최초 생성 시 초기화 상태 확인
-            if not logger.handlers and not logging.getLogger().handlers:
-                cls.initialize()
-                
-        return cls._loggers[name]
+            cls._logger_names.add(name)
+        return logger
     
     @classmethod
     def set_log_level(cls, level):
@@ -90,13 +166,15 @@ class LoggerFactory:
             level (str): 로그 레벨 ('DEBUG', 'INFO', 'WARNING', 'ERROR', 'CRITICAL')
         """
         cls._log_level = level.upper()
-        log_level = cls._get_log_level()
+        cls._cached_level = getattr(logging, cls._log_level, logging.INFO)
+        log_level = cls._cached_level
         
-        # 기존 로거 레벨 업데이트
-        for logger in cls._loggers.values():
-            logger.setLevel(log_level)
+        # 이 팩토리로 생성한 로거만 업데이트 (httpx, msal 등 외부 라이브러리가 지정한 레벨은 유지)
+        # 다른 스레드에서 로거가 추가될 수 있으므로 목록을 복사한 뒤 순회
+        for name in list(cls._logger_names):
+            logging.getLogger(name).setLevel(log_level)
             
-        # 핸들러 레벨 업데이트
+        # 핸들러 레벨 업데이트 (리스너의 출력 핸들러는 큐 핸들러를 통과한 레코드를 모두 출력)
         for handler in logging.getLogger().handlers:
             handler.setLevel(log_level)
         
@@ -104,21 +182,21 @@ class LoggerFactory:
     
     @classmethod
     def _get_formatter(cls):
-        """로그 포맷터를 반환합니다.
+        """로그 포맷터를 반환합니다. (모든 핸들러가 같은 포맷터를 공유)
         
         Returns:
             logging.Formatter: 로그 포맷터
         """
-        return logging.Formatter(cls._log_format)
+        return cls._cached_formatter
     
     @classmethod
     def _get_log_level(cls):
-        """로그 레벨 문자열을 logging 모듈의 레벨 상수로 변환합니다.
+        """현재 로그 레벨에 해당하는 logging 모듈의 레벨 상수를 반환합니다.
         
         Returns:
             int: logging 모듈의 레벨 상수
         """
-        return getattr(logging, cls._log_level, logging.INFO)
+        return cls._cached_level
 
 
 # 모듈 임포트 시 자동으로 초기화
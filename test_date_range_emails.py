@@ -3,14 +3,25 @@
 특정 날짜 범위의 이메일 본문 조회 테스트
 """
 
-import json
 import sys
-from datetime import datetime, timezone
-from pprint import pprint
+import traceback
+from itertools import islice
+from datetime import datetime
 
 from src.services.email_service import EmailService
 
 
+def _preview(text: str, n: int = 100) -> str:
+    """긴 문자열을 앞부분만 잘라 미리보기로 반환합니다."""
+    return text if len(text) <= n else f"{text[:n]}..."
+
+
+def _fmt_dt(dt: datetime, seconds: bool = False) -> str:
+    """날짜를 'YYYY-MM-DD HH:MM[:SS]' 형식으로 변환합니다. (strftime보다 빠른 고정 형식)"""
+    text = f"{dt.year:04d}-{dt.month:02d}-{dt.day:02d} {dt.hour:02d}:{dt.minute:02d}"
+    return f"{text}:{dt.second:02d}" if seconds else text
+
+
 def main():
     """메인 함수"""
     try:
@@ -27,70 +38,76 @@ def main():
         
         print(f"테스트 날짜 범위: {start_date[:10]} ~ {end_date[:10]}")
         
-        # 수신함 이메일 조회 (본문 포함)
-        emails = email_service.get_inbox_emails_with_body(
+        # 수신함 이메일 조회 (목록에는 미리보기만 쓰므로 본문 대신 bodyPreview 조회, 페이지 단위로 받으며 하나씩 처리)
+        emails_iter = email_service.iter_inbox_emails_with_body(
             start_date=start_date,
             end_date=end_date,
             limit=100,  # 최대 100개 조회
             filter_senders=True,  # 필터링 적용
-            convert_html_to_text=True  # HTML을 텍스트로 변환
+            convert_html_to_text=True,  # HTML을 텍스트로 변환
+            body_preview_only=True  # 전체 본문은 상세 정보 출력 시에만 조회
         )
         
-        print(f"\n총 {len(emails)}개의 이메일이 조회되었습니다.\n")
+        # 표시할 10개만 보관하고 나머지는 개수만 셈
+        emails = list(islice(emails_iter, 10))
+        total = len(emails) + sum(1 for _ in emails_iter)
+        
+        print(f"\n총 {total}개의 이메일이 조회되었습니다.\n")
         
-        # 조회된 이메일이 있을 경우 결과 출력
+        # 조회된 이메일이 있을 경우 결과 출력 (출력할 줄을 모아 한 번에 기록)
         if emails:
-            print("조회된 이메일 목록:")
-            print("-" * 50)
+            separator = "-" * 50
+            parts = ["조회된 이메일 목록:", separator]
             
-            for idx, email in enumerate(emails[:10], 1):  # 최대 10개만 표시
-                received_date_str = email.received_date.strftime('%Y-%m-%d %H:%M') if email.received_date else "날짜 없음"
-                body_preview = email.body_content[:100] + "..." if len(email.body_content) > 100 else email.body_content
+            for idx, email in enumerate(emails, 1):  # 최대 10개만 표시
+                received_date_str = _fmt_dt(email.received_date) if email.received_date else "날짜 없음"
                 
-                print(f"{idx}. 제목: {email.subject}")
-                print(f"   발신자: {email.sender.name} <{email.sender.email}>")
-                print(f"   수신일: {received_date_str}")
-                print(f"   본문: {body_preview}")
-                print("-" * 50)
+                parts.append(f"{idx}. 제목: {email.subject}")
+                parts.append(f"   발신자: {email.sender.name} <{email.sender.email}>")
+                parts.append(f"   수신일: {received_date_str}")
+                parts.append(f"   본문: {_preview(email.body_content)}")
+                parts.append(separator)
                 
-            if len(emails) > 10:
-                print(f"... 외 {len(emails) - 10}개 추가 이메일")
+            if total > 10:
+                parts.append(f"... 외 {total - 10}개 추가 이메일")
             
             # 첫 번째 이메일 상세 정보 (전체 본문 포함)
-            print("\n첫 번째 이메일 상세 정보:")
-            print("-" * 50)
+            parts.append("\n첫 번째 이메일 상세 정보:")
+            parts.append(separator)
             
             first_email = emails[0]
+            full_body = first_email.full_body  # 첫 번째 이메일의 전체 본문 조회
             
-            print(f"제목: {first_email.subject}")
-            print(f"발신자: {first_email.sender.name} <{first_email.sender.email}>")
+            parts.append(f"제목: {first_email.subject}")
+            parts.append(f"발신자: {first_email.sender.name} <{first_email.sender.email}>")
             
             if first_email.recipients:
-                recipients_str = ", ".join([f"{r.name} <{r.email}>" for r in first_email.recipients])
-                print(f"수신자: {recipients_str}")
+                recipients_str = ", ".join(f"{r.name} <{r.email}>" for r in first_email.recipients)
+                parts.append(f"수신자: {recipients_str}")
                 
             if first_email.cc_recipients:
-                cc_str = ", ".join([f"{r.name} <{r.email}>" for r in first_email.cc_recipients])
-                print(f"참조: {cc_str}")
+                cc_str = ", ".join(f"{r.name} <{r.email}>" for r in first_email.cc_recipients)
+                parts.append(f"참조: {cc_str}")
                 
-            print(f"수신일: {first_email.received_date.strftime('%Y-%m-%d %H:%M:%S') if first_email.received_date else '날짜 없음'}")
-            print(f"읽음여부: {'읽음' if first_email.is_read else '읽지 않음'}")
-            print(f"중요도: {first_email.importance}")
-            print(f"본문 유형: {first_email.body_type}")
-            print(f"첨부파일: {'있음' if first_email.has_attachments else '없음'}")
+            parts.append(f"수신일: {_fmt_dt(first_email.received_date, seconds=True) if first_email.received_date else '날짜 없음'}")
+            parts.append(f"읽음여부: {'읽음' if first_email.is_read else '읽지 않음'}")
+            parts.append(f"중요도: {first_email.importance}")
+            parts.append(f"본문 유형: {first_email.body_type}")
+            parts.append(f"첨부파일: {'있음' if first_email.has_attachments else '없음'}")
+            
+            parts.append("\n본문 내용 (전체):")
+            parts.append(separator)
+            parts.append(full_body)
+            parts.append(separator)
             
-            print("\n본문 내용 (전체):")
-            print("-" * 50)
-            print(first_email.body_content)
-            print("-" * 50)
+            sys.stdout.write("\n".join(parts) + "\n")
         else:
             print("이 기간에 해당하는 이메일이 없습니다.")
         
         return 0
         
-    except Exception as e:
-        print(f"오류 발생: {str(e)}", file=sys.stderr)
-        import traceback
+    except Exception:
+        # 스택 트레이스는 표준 오류로 한 번만 출력 (콘솔 로그 핸들러는 표준 출력을 사용하므로 로거로 다시 기록하지 않음)
         traceback.print_exc()
         return 1
 
@@ -3,19 +3,22 @@
 이메일 HTML 변환 테스트 스크립트
 """
 
+import functools
 import json
 import sys
-from datetime import datetime
-from pprint import pprint
+import traceback
 
 from src.schemas.email import EmailDto, EmailProcessingOptions
 
+try:
+    import orjson
+except ImportError:
+    # orjson이 설치되지 않은 경우 표준 json 모듈 사용
+    orjson = None
 
-def main():
-    """메인 함수"""
-    try:
-        # 테스트용 HTML 샘플 데이터 준비
-        sample_html = """
+
+# 테스트용 HTML 샘플 데이터 (반복 실행 시 다시 만들지 않도록 모듈 수준에 정의)
+SAMPLE_HTML = """
         <div>
             <table>
                 <tr>
@@ -45,35 +48,65 @@ def main():
             <p>This is a <strong>test</strong> email with some <a href="https://example.com">links</a></p>
         </div>
         """
-        
-        # API 응답 형태의 테스트 데이터 생성
-        test_email_data = {
-            "id": "test-email-id",
-            "subject": "테스트 이메일",
-            "from": {
-                "emailAddress": {
-                    "name": "테스트 발신자",
-                    "address": "sender@example.com"
-                }
-            },
-            "toRecipients": [
-                {
-                    "emailAddress": {
-                        "name": "테스트 수신자",
-                        "address": "recipient@example.com"
-                    }
-                }
-            ],
-            "receivedDateTime": "2023-01-01T00:00:00Z",
-            "body": {
-                "contentType": "html",
-                "content": sample_html
+
+# API 응답 형태의 테스트 데이터
+TEST_EMAIL_DATA = {
+    "id": "test-email-id",
+    "subject": "테스트 이메일",
+    "from": {
+        "emailAddress": {
+            "name": "테스트 발신자",
+            "address": "sender@example.com"
+        }
+    },
+    "toRecipients": [
+        {
+            "emailAddress": {
+                "name": "테스트 수신자",
+                "address": "recipient@example.com"
             }
         }
-        
+    ],
+    "receivedDateTime": "2023-01-01T00:00:00Z",
+    "body": {
+        "contentType": "html",
+        "content": SAMPLE_HTML
+    }
+}
+
+
+def _preview(text: str, n: int = 200) -> str:
+    """긴 문자열을 앞부분만 잘라 미리보기로 반환합니다."""
+    return text if len(text) <= n else f"{text[:n]}..."
+
+
+def _dumps(data: dict) -> str:
+    """데이터를 들여쓰기 2칸의 JSON 문자열로 직렬화합니다. (datetime은 ISO 8601 형식)"""
+    if orjson is not None:
+        return orjson.dumps(data, option=orjson.OPT_INDENT_2).decode("utf-8")
+    return json.dumps(data, ensure_ascii=False, indent=2, default=lambda value: value.isoformat())
+
+
+@functools.lru_cache(maxsize=32)
+def _convert_cached(convert_html_to_text: bool) -> EmailDto:
+    """테스트 데이터를 EmailDto로 변환합니다.
+    
+    테스트 데이터는 모듈 상수이므로 변환 옵션만 키로 사용하며,
+    반복 실행 시 html2text 변환을 다시 수행하지 않습니다.
+    """
+    processing_options = EmailProcessingOptions(
+        convert_html_to_text=convert_html_to_text,
+        include_body=True
+    )
+    return EmailDto.from_dict(TEST_EMAIL_DATA, processing_options)
+
+
+def main():
+    """메인 함수"""
+    try:
         print("[1] 테스트 HTML 데이터:")
         print("-" * 50)
-        print(sample_html[:200] + "..." if len(sample_html) > 200 else sample_html)
+        print(_preview(SAMPLE_HTML))
         print("-" * 50)
         
         # 2. EmailDto로 변환 처리
@@ -87,14 +120,8 @@ def main():
         except ImportError:
             print("html2text 패키지를 임포트할 수 없습니다!")
         
-        # 기본 처리 옵션 (HTML → 텍스트 변환 활성화)
-        processing_options = EmailProcessingOptions(
-            convert_html_to_text=True,
-            include_body=True
-        )
-        
-        # EmailDto로 변환
-        email_dto = EmailDto.from_dict(test_email_data, processing_options)
+        # EmailDto로 변환 (HTML → 텍스트 변환 활성화)
+        email_dto = _convert_cached(True)
         
         # 변환된 본문 출력
         print("\n[3] 변환 결과 (텍스트 본문):")
@@ -104,13 +131,9 @@ def main():
         
         # 기본 처리 옵션 (HTML → 텍스트 변환 비활성화 - 비교용)
         print("\n[4] 비교: HTML 변환 비활성화")
-        no_convert_options = EmailProcessingOptions(
-            convert_html_to_text=False,
-            include_body=True
-        )
         
         # EmailDto로 변환 (변환 비활성화)
-        no_convert_dto = EmailDto.from_dict(test_email_data, no_convert_options)
+        no_convert_dto = _convert_cached(False)
         
         # 원본 HTML (처리되지 않은) 출력
         print("-" * 50)
@@ -126,7 +149,7 @@ def main():
         dto_dict = {
             "id": email_dto.id,
             "subject": email_dto.subject,
-            "body_content": email_dto.body_content[:200] + "..." if len(email_dto.body_content) > 200 else email_dto.body_content,
+            "body_content": _preview(email_dto.body_content),
             "body_type": email_dto.body_type,
             "sender": {
                 "email": email_dto.sender.email,
@@ -138,19 +161,18 @@ def main():
                 "name": recipient.name,
                 "type": recipient.type
             } for recipient in email_dto.recipients],
-            "received_date": email_dto.received_date.isoformat() if email_dto.received_date else None,
+            "received_date": email_dto.received_date,
             "is_read": email_dto.is_read
         }
         
         # JSON 출력
-        print(json.dumps(dto_dict, ensure_ascii=False, indent=2))
+        print(_dumps(dto_dict))
         print("-" * 50)
         
         return 0
         
-    except Exception as e:
-        print(f"오류 발생: {str(e)}", file=sys.stderr)
-        import traceback
+    except Exception:
+        # 스택 트레이스는 표준 오류로 한 번만 출력 (콘솔 로그 핸들러는 표준 출력을 사용하므로 로거로 다시 기록하지 않음)
         traceback.print_exc()
         return 1
 
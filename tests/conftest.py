@@ -0,0 +1,43 @@
+"""테스트 공용 픽스처 모듈"""
+
+from typing import Any, Dict
+
+import pytest
+
+from src.infra.config import Config
+from src.infra.graph_gateway import GraphApiGateway
+
+
+class FakeAuthManager:
+    """항상 같은 액세스 토큰을 반환하는 인증 토큰 관리자"""
+    
+    def get_token(self) -> Dict[str, str]:
+        return {"access_token": "token"}
+
+
+@pytest.fixture
+def gateway(monkeypatch, tmp_path):
+    """델타 링크를 임시 파일에 저장하는 게이트웨이"""
+    monkeypatch.setattr(Config, "DELTA_LINK_FILE", str(tmp_path / "delta_link.json"))
+    return GraphApiGateway(auth_manager=FakeAuthManager())
+
+
+@pytest.fixture
+def service(monkeypatch, gateway):
+    """테스트용 게이트웨이를 사용하는 이메일 서비스"""
+    from src.services import email_service
+    
+    monkeypatch.setattr(email_service, "get_default_gateway", lambda: gateway)
+    return email_service.EmailService()
+
+
+def make_message(index: int, folder: str = "inbox") -> Dict[str, Any]:
+    """Graph API 메시지 응답 항목을 생성합니다."""
+    return {
+        "id": f"{folder}-{index}",
+        "subject": f"제목 {index}",
+        "bodyPreview": f"미리보기 {index}",
+        "body": {"contentType": "html", "content": f"<p>본문 {index}</p>"},
+        "from": {"emailAddress": {"name": f"보낸 사람 {index}", "address": f"sender{index}@example.com"}},
+        "receivedDateTime": "2025-03-01T00:00:00Z",
+    }
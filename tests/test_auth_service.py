@@ -0,0 +1,67 @@
+"""AuthService 테스트 모듈"""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from src.schemas.auth import AuthStatus
+from src.services import auth_service
+
+
+class FakeAuthTokenManager:
+    """인증 상태와 호출 횟수를 기록하는 토큰 관리자"""
+    
+    def __init__(self):
+        self.authenticated = True
+        self.expires_at = datetime.now() + timedelta(hours=1)
+        self.status_calls = 0
+        self.check_calls = 0
+        
+    def get_auth_status(self) -> AuthStatus:
+        self.status_calls += 1
+        return AuthStatus(
+            is_authenticated=self.authenticated,
+            token_expires_at=self.expires_at if self.authenticated else None
+        )
+        
+    def is_authenticated(self) -> bool:
+        self.check_calls += 1
+        return self.authenticated
+
+
+@pytest.fixture
+def service(monkeypatch):
+    """가짜 토큰 관리자를 사용하는 인증 서비스"""
+    monkeypatch.setattr(auth_service, "AuthTokenManager", FakeAuthTokenManager)
+    return auth_service.AuthService()
+
+
+def test_is_authenticated_uses_cached_status(service):
+    """유효한 토큰으로 인증된 상태가 캐시되어 있으면 토큰 관리자를 다시 조회하지 않는지 확인"""
+    service.get_auth_status()
+    
+    assert service.is_authenticated()
+    assert service.auth_manager.check_calls == 0
+
+
+def test_is_authenticated_ignores_cached_status_with_expired_token(service):
+    """캐시된 상태의 토큰이 만료되었으면 토큰 관리자를 다시 조회하는지 확인"""
+    service.auth_manager.expires_at = datetime.now() - timedelta(seconds=1)
+    service.get_auth_status()
+    service.auth_manager.authenticated = False
+    
+    assert not service.is_authenticated()
+    assert service.auth_manager.check_calls == 1
+    
+    service.get_auth_status()
+    assert service.auth_manager.status_calls == 2
+
+
+def test_default_auth_service_is_shared(monkeypatch):
+    """기본 인증 서비스는 하나의 인스턴스를 공유하는지 확인"""
+    monkeypatch.setattr(auth_service, "AuthTokenManager", FakeAuthTokenManager)
+    auth_service.get_default_auth_service.cache_clear()
+    try:
+        assert auth_service.get_default_auth_service() is auth_service.get_default_auth_service()
+    finally:
+        auth_service.get_default_auth_service.cache_clear()
@@ -0,0 +1,55 @@
+"""EmailDto 테스트 모듈"""
+
+import copy
+
+from src.schemas.email import EmailDto, EmailProcessingOptions
+
+try:
+    from pydantic import TypeAdapter
+except ImportError:
+    # pydantic 1.x
+    from pydantic import parse_obj_as
+    
+    def _validate(data):
+        return parse_obj_as(EmailDto, data)
+else:
+    def _validate(data):
+        return TypeAdapter(EmailDto).validate_python(data)
+
+
+def test_email_dto_built_by_pydantic_exposes_body():
+    """pydantic/FastAPI가 딕셔너리로 생성한 EmailDto의 본문을 읽을 수 있는지 확인"""
+    email = _validate({
+        "id": "m1",
+        "subject": "제목",
+        "body_content": "본문",
+        "body_type": "text",
+        "sender": {"email": "sender@example.com", "name": "보낸 사람"},
+    })
+    
+    assert isinstance(email, EmailDto)
+    assert email.body_content == "본문"
+    assert email.body_type == "text"
+    assert email.to_graph_payload()["body"] == {"contentType": "text", "content": "본문"}
+
+
+def test_pending_html_is_converted_on_first_read():
+    """HTML 본문은 처음 읽을 때 변환되고, 직접 설정한 본문은 변환하지 않는지 확인"""
+    data = {
+        "id": "m1",
+        "subject": "제목",
+        "body": {"contentType": "html", "content": "<p>안녕하세요</p>"},
+        "from": {"emailAddress": {"name": "보낸 사람", "address": "sender@example.com"}},
+    }
+    
+    email = EmailDto.from_dict(data)
+    assert email.body_type == "text"
+    assert email.body_content == "안녕하세요"
+    
+    raw = EmailDto.from_dict(data, EmailProcessingOptions(convert_html_to_text=False))
+    assert raw.body_type == "html"
+    
+    email = EmailDto.from_dict(data)
+    email.body_content = "직접 설정"
+    assert email.body_content == "직접 설정"
+    assert copy.copy(email).body_content == "직접 설정"
@@ -0,0 +1,148 @@
+"""EmailService 테스트 모듈
+
+Graph API 요청은 게이트웨이의 _make_request를 대체하여 실제 네트워크 호출 없이 검증합니다.
+"""
+
+import time
+
+from src.infra.config import Config
+from src.schemas import email as email_schema
+from src.services import email_service
+from tests.conftest import make_message
+
+
+def _paged_responses(calls):
+    """nextLink로 100개씩 나누어 응답하는 _make_request 대체 함수를 반환합니다."""
+    def fake_request(method, endpoint, params=None, json=None, expand=None):
+        calls.append((method, endpoint, params))
+        page = sum(1 for call in calls if "$count" not in call[1]) - 1
+        response = {"value": [make_message(page * 100 + i) for i in range(100)]}
+        if page < 9:
+            response["@odata.nextLink"] = f"https://graph.microsoft.com/v1.0/next?page={page + 1}"
+        return response
+    return fake_request
+
+
+def test_folder_query_follows_next_link_by_default(service):
+    """기본 조회는 $count/$skip 병렬 조회가 아닌 nextLink 페이지 조회를 사용하는지 확인"""
+    calls = []
+    service.graph_gateway._make_request = _paged_responses(calls)
+    
+    emails = service.iter_inbox_emails_with_body(limit=1000, filter_senders=False)
+    first = next(emails)
+    
+    # 첫 페이지만 요청한 상태에서 첫 메시지를 반환
+    assert first.id == "inbox-0"
+    assert len(calls) == 1
+    assert not any("$count" in endpoint or (params and "$skip" in params) for _, endpoint, params in calls)
+    
+    assert len(list(emails)) == 999
+    assert len(calls) == 10
+
+
+def test_folder_query_uses_parallel_fetch_when_enabled(service, monkeypatch):
+    """PARALLEL_FETCH 설정을 켠 경우에만 $skip 범위별 병렬 조회를 사용하는지 확인"""
+    monkeypatch.setattr(Config, "PARALLEL_FETCH", True)
+    calls = []
+    
+    def fake_request(method, endpoint, params=None, json=None, expand=None):
+        calls.append(endpoint)
+        if endpoint.endswith("/$count"):
+            return 300
+        return {"value": [make_message(params["$skip"] + i) for i in range(params["$top"])]}
+        
+    service.graph_gateway._make_request = fake_request
+    
+    emails = service.get_inbox_emails_with_body(limit=1000, filter_senders=False)
+    
+    assert calls[0].endswith("/$count")
+    assert [email.id for email in emails] == [f"inbox-{i}" for i in range(300)]
+
+
+def _folder_responses(calls, available):
+    """폴더별로 available개까지만 메시지가 있는 $batch/목록 응답 함수를 반환합니다."""
+    def messages(url, top):
+        folder = url.split("/")[3]
+        return [make_message(i, folder) for i in range(min(top, available[folder]))]
+        
+    def fake_request(method, endpoint, params=None, json=None, expand=None):
+        if endpoint == "/$batch":
+            calls.append([request["url"] for request in json["requests"]])
+            return {"responses": [
+                {"id": request["id"], "status": 200, "body": {"value": messages(
+                    request["url"], int(request["url"].split("$top=")[1].split("&")[0])
+                )}}
+                for request in json["requests"]
+            ]}
+        calls.append([f"{endpoint}?$top={params['$top']}"])
+        return {"value": messages(endpoint, params["$top"])}
+    return fake_request
+
+
+def test_total_limit_fetches_only_each_folders_share(service):
+    """total_limit이 있으면 폴더별로 자신의 몫만 요청하는지 확인"""
+    calls = []
+    service.graph_gateway._make_request = _folder_responses(calls, {"inbox": 100, "sentItems": 100})
+    
+    result = service.get_all_emails(total_limit=10, filter_senders=False)
+    
+    assert len(calls) == 1
+    assert ["$top=5" in url for url in calls[0]] == [True, True]
+    assert (len(result["inbox"]), len(result["sentItems"])) == (5, 5)
+
+
+def test_total_limit_moves_unused_share_to_other_folder(service):
+    """한 폴더가 몫을 채우지 못하면 남은 수만큼 다른 폴더를 조회하는지 확인"""
+    calls = []
+    service.graph_gateway._make_request = _folder_responses(calls, {"inbox": 2, "sentItems": 100})
+    
+    result = service.get_all_emails(total_limit=10, filter_senders=False)
+    
+    assert (len(result["inbox"]), len(result["sentItems"])) == (2, 8)
+    assert "sentItems" in calls[1][0] and "$top=8" in calls[1][0]
+
+
+def test_total_limit_skips_folder_without_share(service):
+    """몫이 없는 폴더는 요청하지 않는지 확인"""
+    calls = []
+    service.graph_gateway._make_request = _folder_responses(calls, {"inbox": 100, "sentItems": 100})
+    
+    result = service.get_all_emails(total_limit=1, filter_senders=False)
+    
+    assert calls == [["/me/mailFolders/inbox/messages?$top=1"]]
+    assert (len(result["inbox"]), len(result["sentItems"])) == (1, 0)
+
+
+def test_cached_copies_convert_html_body_once(service, monkeypatch):
+    """캐시에서 반환한 사본들이 같은 HTML 본문을 한 번만 변환하는지 확인"""
+    conversions = []
+    original = email_schema._html_to_text
+    monkeypatch.setattr(email_schema, "_html_to_text", lambda html: conversions.append(html) or original(html))
+    service.graph_gateway._make_request = lambda *args, **kwargs: {"value": [make_message(0)]}
+    
+    first = service.get_inbox_emails_with_body(limit=1, filter_senders=False)
+    second = service.get_inbox_emails_with_body(limit=1, filter_senders=False)
+    
+    assert first[0] is not second[0]
+    assert first[0].body_content == second[0].body_content == "본문 0"
+    assert len(conversions) == 1
+    
+    # 호출자가 바꾼 본문은 다른 호출자에게 보이지 않음
+    first[0].body_content = "수정"
+    assert service.get_inbox_emails_with_body(limit=1, filter_senders=False)[0].body_content == "본문 0"
+
+
+def test_days_query_cache_key_changes_every_minute(service, monkeypatch):
+    """최근 N일 조회는 분이 바뀌면 캐시를 사용하지 않는지 확인"""
+    calls = []
+    service.graph_gateway._make_request = lambda *args, **kwargs: calls.append(args) or {"value": []}
+    now = time.time()
+    
+    monkeypatch.setattr(email_service.time, "time", lambda: now)
+    service.get_inbox_emails(days=1, filter_senders=False)
+    service.get_inbox_emails(days=1, filter_senders=False)
+    assert len(calls) == 1
+    
+    monkeypatch.setattr(email_service.time, "time", lambda: now + 60)
+    service.get_inbox_emails(days=1, filter_senders=False)
+    assert len(calls) == 2
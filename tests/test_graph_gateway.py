@@ -0,0 +1,188 @@
+"""GraphApiGateway 테스트 모듈
+
+Graph API 요청은 _make_request를 대체하여 실제 네트워크 호출 없이 검증합니다.
+"""
+
+import time
+from itertools import islice
+from typing import Any, Dict, List, Optional
+
+import pytest
+
+from src.infra import graph_gateway
+from src.infra.config import Config
+from src.schemas.email import EmailDto, EmailFilter, EmailParticipant, EmailProcessingOptions
+from src.utils.exceptions import GraphApiError
+from tests.conftest import make_message
+
+
+class FakeDeltaGraph:
+    """$select에 따라 응답 필드를 제한하는 델타 쿼리 응답기
+    
+    델타 링크에는 처음 요청한 $select가 들어 있으므로, 링크로 이어서 조회하면
+    링크를 만든 요청의 필드만 반환합니다.
+    """
+    
+    def __init__(self) -> None:
+        self.calls: List[Any] = []
+        self.links: Dict[str, str] = {}
+        
+    def __call__(
+        self,
+        method: str,
+        endpoint: str,
+        params: Optional[Dict[str, Any]] = None,
+        json: Optional[Dict[str, Any]] = None,
+        expand: Optional[str] = None
+    ) -> Dict[str, Any]:
+        self.calls.append((method, endpoint, params))
+        
+        if endpoint in self.links:
+            select = self.links[endpoint]
+        else:
+            select = params["$select"]
+            
+        message = {
+            "id": "m1",
+            "subject": "제목",
+            "bodyPreview": "미리보기",
+            "from": {"emailAddress": {"name": "보낸 사람", "address": "sender@example.com"}},
+            "receivedDateTime": "2025-03-01T00:00:00Z",
+        }
+        if "body" in select.split(","):
+            message["body"] = {"contentType": "text", "content": "전체 본문"}
+            
+        delta_link = f"https://graph.microsoft.com/v1.0/delta?token={len(self.links)}"
+        self.links[delta_link] = select
+        return {"value": [message], "@odata.deltaLink": delta_link}
+
+
+@pytest.fixture
+def delta_gateway(gateway):
+    """델타 쿼리 응답기를 사용하는 게이트웨이"""
+    gateway._make_request = FakeDeltaGraph()
+    return gateway
+
+
+def test_delta_link_is_not_shared_between_metadata_and_body_queries(delta_gateway):
+    """메타데이터 델타 조회 후 본문 델타 조회가 메타데이터 델타 링크를 재사용하지 않는지 확인"""
+    metadata_options = EmailProcessingOptions(include_body=False, apply_filters=False)
+    body_options = EmailProcessingOptions(include_body=True, apply_filters=False)
+    
+    metadata_emails, _ = delta_gateway.get_delta_changes("inbox", metadata_options)
+    body_emails, _ = delta_gateway.get_delta_changes("inbox", body_options)
+    
+    assert metadata_emails[0].body_content == ""
+    assert body_emails[0].body_content == "전체 본문"
+    
+    # 두 번째 조회는 저장된 메타데이터 델타 링크가 아닌 새 델타 쿼리로 시작
+    _, endpoint, params = delta_gateway._make_request.calls[1]
+    assert endpoint.endswith("/delta")
+    assert "body" in params["$select"].split(",")
+    
+    # 각 조회는 자신의 델타 링크로 이어서 조회
+    metadata_link = Config.get_delta_link("inbox_delta_meta")
+    body_link = Config.get_delta_link("inbox_delta_full")
+    assert metadata_link != body_link
+    
+    delta_gateway.get_delta_changes("inbox", metadata_options)
+    body_emails, _ = delta_gateway.get_delta_changes("inbox", body_options)
+    
+    assert delta_gateway._make_request.calls[2][1] == metadata_link
+    assert delta_gateway._make_request.calls[3][1] == body_link
+    assert body_emails[0].body_content == "전체 본문"
+
+
+def test_iter_messages_parallel_streams_pages_in_order(gateway):
+    """병렬 조회가 페이지를 정렬 순서대로 반환하고, 중간에 멈추면 남은 요청을 보내지 않는지 확인"""
+    requested_skips = []
+    
+    def fake_request(method, endpoint, params=None, json=None, expand=None):
+        if endpoint.endswith("/$count"):
+            return 1000
+        requested_skips.append(params["$skip"])
+        if params["$skip"]:
+            # 뒤 페이지는 느리게 응답하여 첫 페이지를 소비하는 동안 요청이 남아 있도록 함
+            time.sleep(0.05)
+        return {"value": [make_message(params["$skip"] + i) for i in range(params["$top"])]}
+        
+    gateway._make_request = fake_request
+    options = EmailProcessingOptions(apply_filters=False)
+    
+    emails = gateway.iter_messages_parallel(EmailFilter(limit=1000), options, workers=1)
+    first_page = list(islice(emails, 100))
+    emails.close()
+    
+    assert [email.id for email in first_page] == [f"inbox-{i}" for i in range(100)]
+    assert len(requested_skips) < 10
+    
+    emails = gateway.get_messages_parallel(EmailFilter(limit=250), options)
+    assert [email.id for email in emails] == [f"inbox-{i}" for i in range(250)]
+
+
+def _failing_request(calls, status_code, failures):
+    """처음 failures번은 status_code 오류로 응답하는 _make_request 대체 함수를 반환합니다."""
+    def fake_request(method, endpoint, params=None, json=None, expand=None):
+        calls.append((method, endpoint))
+        if len(calls) <= failures:
+            raise GraphApiError("오류", status_code=status_code)
+        if endpoint == "/$batch":
+            return {"responses": [
+                {"id": request["id"], "status": 200, "body": {"value": [make_message(0)]}}
+                for request in json["requests"]
+            ]}
+        return {}
+    return fake_request
+
+
+@pytest.fixture
+def no_sleep(monkeypatch):
+    """재시도 대기 시간을 건너뜁니다."""
+    monkeypatch.setattr(graph_gateway.time, "sleep", lambda seconds: None)
+
+
+def test_send_message_is_not_retried_on_503(gateway, no_sleep):
+    """발송 요청(POST)은 이미 처리되었을 수 있는 503을 재시도하지 않는지 확인"""
+    calls = []
+    gateway._make_request = _failing_request(calls, 503, failures=1)
+    email = EmailDto(
+        id="", subject="제목", body_content="본문", body_type="text",
+        sender=EmailParticipant(email="sender@example.com")
+    )
+    
+    with pytest.raises(GraphApiError):
+        gateway.send_message(email)
+    assert len(calls) == 1
+
+
+def test_send_message_is_retried_on_429(gateway, no_sleep):
+    """발송 요청(POST)도 처리되지 않은 429는 재시도하는지 확인"""
+    calls = []
+    gateway._make_request = _failing_request(calls, 429, failures=1)
+    email = EmailDto(
+        id="", subject="제목", body_content="본문", body_type="text",
+        sender=EmailParticipant(email="sender@example.com")
+    )
+    
+    assert gateway.send_message(email)
+    assert len(calls) == 2
+
+
+def test_get_is_retried_on_503(gateway, no_sleep):
+    """조회 요청(GET)은 503을 재시도하는지 확인"""
+    calls = []
+    gateway._make_request = _failing_request(calls, 503, failures=2)
+    
+    gateway._request_with_backoff("GET", "/me")
+    assert len(calls) == 3
+
+
+def test_batch_request_is_retried_on_top_level_429(gateway, no_sleep):
+    """$batch 요청 자체가 429로 응답하면 재시도하는지 확인"""
+    calls = []
+    gateway._make_request = _failing_request(calls, 429, failures=1)
+    
+    results = gateway.batch_get_messages([EmailFilter()], EmailProcessingOptions(apply_filters=False))
+    
+    assert [email.id for email in results[0]] == ["inbox-0"]
+    assert calls == [("POST", "/$batch"), ("POST", "/$batch")]
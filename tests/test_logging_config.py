@@ -0,0 +1,27 @@
+"""LoggerFactory 테스트 모듈"""
+
+import logging
+
+import pytest
+
+from src.utils.logging_config import LoggerFactory
+
+
+@pytest.fixture
+def restore_log_level():
+    """테스트가 바꾼 로그 레벨을 원래대로 되돌립니다."""
+    level = LoggerFactory._log_level
+    yield
+    LoggerFactory.set_log_level(level)
+
+
+def test_set_log_level_keeps_third_party_logger_levels(restore_log_level):
+    """set_log_level()이 팩토리로 생성한 로거만 변경하고 외부 라이브러리 로거의 레벨은 유지하는지 확인"""
+    app_logger = LoggerFactory.get_logger("src.tests.app")
+    library_logger = logging.getLogger("tests.third_party")
+    library_logger.setLevel(logging.WARNING)
+    
+    LoggerFactory.set_log_level("DEBUG")
+    
+    assert app_logger.level == logging.DEBUG
+    assert library_logger.level == logging.WARNING